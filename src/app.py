@@ -2,9 +2,17 @@
 Mango-Style Cantonese Learning App
 Main entry point - handles routing only
 """
+import time
 import streamlit as st
+from utils.profiling import get_profiler
+
+_rerun_start = time.perf_counter()
 from core.state import init_session_state
 from pages import library, dashboard, lesson, review
+from components.debug_panel import render_debug_panel
+
+# Module imports only cost time on the first run in a process
+get_profiler().record_once('startup.imports', time.perf_counter() - _rerun_start)
 
 st.set_page_config(
     layout="wide",
@@ -75,4 +83,9 @@ elif st.session_state.view == 'dashboard':
 elif st.session_state.view == 'lesson':
     lesson.render()
 elif st.session_state.view == 'review':
-    review.render()
\ No newline at end of file
+    review.render()
+
+get_profiler().record(f"rerun.{st.session_state.view}", time.perf_counter() - _rerun_start)
+
+with st.sidebar:
+    render_debug_panel()
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Import-Time Benchmark
+Cold-start cost of the app's modules, measured in fresh interpreters
+
+    python -m benchmarks.import_time --runs 5 [--json]
+
+Each scenario runs in a new Python process so nothing is already imported.
+The report lists median wall time and which heavy dependencies were
+loaded; app startup should load none of them, while the generation
+scenarios show what is deferred until a unit is actually created.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('openai', 'dotenv', 'pycantonese', 'edge_tts')
+
+SCENARIOS = {
+    'startup: library page': "import pages.library",
+    'startup: generation queue': "import generators.job_queue",
+    'generation: openai client': (
+        "import generators.content_generator as c; c.get_client()"
+    ),
+    'generation: jyutping data': (
+        "import utils.jyutping as j; j.warm_up_jyutping()"
+    ),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_scenario(code: str, runs: int) -> Dict:
+    """
+    Time `code` in `runs` fresh interpreters
+
+    Returns:
+        Dict with median/min seconds and the heavy modules loaded, or an
+        'error' entry if the scenario cannot run here (e.g. streamlit missing)
+    """
+    env = dict(os.environ, OPENAI_API_KEY=os.environ.get('OPENAI_API_KEY', 'benchmark'),
+               CANTO_WARMUP='0')
+    samples = []
+    loaded: List[str] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code=code, heavy=HEAVY_MODULES)],
+            cwd=SRC_DIR, env=env, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            last_line = (result.stderr.strip().splitlines() or ["failed"])[-1]
+            return {'error': last_line}
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        samples.append(probe['seconds'])
+        loaded = probe['loaded']
+    return {
+        'median_ms': round(statistics.median(samples) * 1000, 1),
+        'min_ms': round(min(samples) * 1000, 1),
+        'runs': runs,
+        'heavy_modules': loaded
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure cold import time of app modules")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per scenario")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {name: run_scenario(code, args.runs) for name, code in SCENARIOS.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    for name, result in results.items():
+        if 'error' in result:
+            print(f"{name:<30} skipped ({result['error']})")
+            continue
+        heavy = ", ".join(result['heavy_modules']) or "none"
+        print(f"{name:<30} {result['median_ms']:>8.1f} ms median "
+              f"({result['min_ms']:.1f} min)   heavy modules: {heavy}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
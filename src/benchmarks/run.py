@@ -0,0 +1,250 @@
+"""
+Benchmark Suite
+Times the service, lesson and player hot paths on synthetic data at several scales
+
+    python -m benchmarks.run --scales small,medium --output results.json
+    python -m benchmarks.run --compare results.json --threshold 1.25
+
+Each scale runs in its own process against a scratch CANTO_DATA_ROOT, so
+module-level caches start cold and the real data directory is never
+touched. Results are JSON with one entry per benchmark (median, p95, min,
+mean, iterations); --compare reports the ratio against an earlier run and
+exits non-zero when a median regressed past the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (units, cards, progress entries)
+SCALES = {
+    'small': {'units': 20, 'cards': 500, 'progress': 100},
+    'medium': {'units': 100, 'cards': 5000, 'progress': 500},
+    'large': {'units': 400, 'cards': 20000, 'progress': 2000},
+}
+
+
+def measure(fn: Callable[[], None], min_time: float, max_iterations: int = 500,
+            setup: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    Call `fn` until `min_time` seconds (and at least 5 calls) have been timed
+
+    Args:
+        fn: Operation to time
+        min_time: Seconds of timed calls to collect
+        max_iterations: Upper bound on timed calls
+        setup: Untimed preparation before each call (e.g. clearing a cache)
+
+    Returns:
+        Dict of median/p95/min/mean milliseconds and the iteration count
+    """
+    if setup:
+        setup()
+    fn()  # Warm-up
+
+    samples: List[float] = []
+    while len(samples) < max_iterations and (sum(samples) < min_time or len(samples) < 5):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    samples.sort()
+    return {
+        'median_ms': round(statistics.median(samples) * 1000, 4),
+        'p95_ms': round(samples[min(len(samples) - 1, int(0.95 * len(samples)))] * 1000, 4),
+        'min_ms': round(samples[0] * 1000, 4),
+        'mean_ms': round(statistics.fmean(samples) * 1000, 4),
+        'iterations': len(samples)
+    }
+
+
+def run_worker(scale: str, min_time: float) -> Dict:
+    """Seed synthetic data into CANTO_DATA_ROOT and run every benchmark"""
+    from benchmarks import synthetic
+    from services.unit_service import get_all_units, load_unit, search_unit_summaries
+    from services.srs_service import get_due_cards, update_card, add_vocabulary
+    from services.progress_service import get_all_progress
+    from services.lesson_service import generate_lesson_plan
+    from services import payload_service
+    from utils import audio
+
+    params = SCALES[scale]
+    start = time.perf_counter()
+    data = synthetic.seed(**params)
+    seed_seconds = time.perf_counter() - start
+
+    rng = random.Random(1)
+    words = data['words'][:params['cards']]
+    unit = data['units'][0]
+    results: Dict[str, Dict] = {}
+
+    def list_and_load():
+        for filename in get_all_units():
+            load_unit(filename)
+
+    results['units.list_and_load'] = measure(list_and_load, min_time)
+    results['units.search_page'] = measure(lambda: search_unit_summaries('', 0, 12), min_time)
+    results['progress.get_all_progress'] = measure(get_all_progress, min_time)
+    results['srs.get_due_cards'] = measure(get_due_cards, min_time)
+    results['srs.get_due_cards_20'] = measure(lambda: get_due_cards(20), min_time)
+    results['srs.update_card'] = measure(
+        lambda: update_card(rng.choice(words), rng.choice((0, 3, 5))), min_time
+    )
+
+    counter = iter(range(10 ** 9))
+
+    def add_batch():
+        # Half already known, half new, like a freshly generated unit
+        batch = [{'cantonese': rng.choice(words)} for _ in range(10)]
+        batch += [{'cantonese': f"新詞{next(counter)}"} for _ in range(10)]
+        add_vocabulary(batch)
+
+    results['srs.add_vocabulary'] = measure(add_batch, min_time)
+
+    results['lesson.generate_lesson_plan'] = measure(
+        lambda: generate_lesson_plan(unit['conversation'], 'full'), min_time
+    )
+    plan = generate_lesson_plan(unit['conversation'], 'full')
+
+    results['payload.process_slides'] = measure(lambda: payload_service.process_slides(plan), min_time)
+    results['payload.write_unit'] = measure(lambda: payload_service.write_unit_payloads(unit), min_time)
+    results['payload.read'] = measure(
+        lambda: payload_service.read_lesson_payload(unit, 0, len(unit['conversation']), 'quick'), min_time
+    )
+    stored = payload_service.read_lesson_payload(unit, 0, len(unit['conversation']), 'quick')
+    results['payload.resolve_audio_refs'] = measure(
+        lambda: payload_service.resolve_audio_refs(stored), min_time
+    )
+
+    rel_path = data['audio'][1]
+    results['audio.get_b64_audio_cold'] = measure(
+        lambda: audio.get_b64_audio(rel_path), min_time, setup=audio._b64_cache.clear
+    )
+    results['audio.get_b64_audio_warm'] = measure(lambda: audio.get_b64_audio(rel_path), min_time)
+
+    try:
+        from components import player
+    except ImportError as e:
+        results['player.build_payload'] = {'skipped': f"{type(e).__name__}: {e}"}
+    else:
+        results['player.build_payload'] = measure(lambda: player.build_player_payload(plan), min_time)
+
+    return {'params': params, 'seed_seconds': round(seed_seconds, 3), 'results': results}
+
+
+def run_scale(scale: str, backend: str, min_time: float) -> Dict:
+    """Run one scale in a subprocess with its own scratch data root"""
+    with tempfile.TemporaryDirectory(prefix=f"canto-bench-{scale}-") as root:
+        env = dict(os.environ, CANTO_DATA_ROOT=root, CANTO_STORAGE=backend,
+                   CANTO_AUDIO_DELIVERY='inline', CANTO_WARMUP='0')
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", "--worker", scale, "--min-time", str(min_time)],
+            cwd=SRC_DIR, env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"Scale '{scale}' failed:\n{result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SRC_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """
+    Print median ratios against a baseline run
+
+    Returns:
+        Names ("scale/benchmark") whose median grew by more than `threshold`x
+    """
+    regressions = []
+    for scale, run in current['scales'].items():
+        base_results = baseline.get('scales', {}).get(scale, {}).get('results', {})
+        for name, result in run['results'].items():
+            base = base_results.get(name)
+            if 'median_ms' not in result or not base or 'median_ms' not in base:
+                continue
+            ratio = result['median_ms'] / base['median_ms'] if base['median_ms'] else 1.0
+            flag = ""
+            if ratio > threshold:
+                flag = "  ⚠️ regression"
+                regressions.append(f"{scale}/{name}")
+            print(f"{scale:<8} {name:<30} {base['median_ms']:>10.3f} → "
+                  f"{result['median_ms']:>10.3f} ms  ({ratio:.2f}x){flag}")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark hot paths on synthetic data")
+    parser.add_argument('--scales', default="small,medium",
+                        help=f"Comma-separated scales ({', '.join(SCALES)})")
+    parser.add_argument('--backend', default=os.getenv("CANTO_STORAGE", "json"),
+                        help="Storage backend to benchmark (json or sqlite)")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Seconds of timed calls per benchmark")
+    parser.add_argument('--output', help="Write results JSON to this file")
+    parser.add_argument('--compare', help="Baseline results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Median ratio counted as a regression (default 1.25)")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.min_time)))
+        return 0
+
+    scales = [s.strip() for s in args.scales.split(',') if s.strip()]
+    unknown = [s for s in scales if s not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+
+    report = {
+        'meta': {
+            'created_at': time.time(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': args.backend,
+            'min_time': args.min_time
+        },
+        'scales': {}
+    }
+    for scale in scales:
+        print(f"⏱️ {scale}: {SCALES[scale]}", file=sys.stderr)
+        report['scales'][scale] = run_scale(scale, args.backend, args.min_time)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
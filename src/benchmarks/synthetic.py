@@ -0,0 +1,133 @@
+"""
+Synthetic Data
+Deterministic units, cards, progress and audio files for benchmarks
+"""
+import os
+import random
+import time
+import zlib
+from typing import Dict, List
+from core.constants import AUDIO_DIR, LESSON_CHUNK_SIZE
+from services.storage import get_storage
+
+# Common characters so chunks recur across units like real vocabulary does
+CHARACTERS = (
+    "我你佢哋嘅咗緊過喺有冇係唔好多少大細人個啲嗰呢去嚟食飲睇聽講話買賣"
+    "屋企學校公司街市餐廳茶樓巴士地鐵今日聽日琴日朝早晏晝夜晚錢蚊幾多邊度"
+)
+PARTICLES = "呀啊喇喎咩呢㗎啦"
+SENTENCES_PER_UNIT = 8
+AUDIO_FILE_BYTES = 12 * 1024  # Roughly one short TTS clip
+
+
+def _chunk(rng: random.Random, pool: List[str]) -> Dict:
+    text = rng.choice(pool)
+    return {
+        'cantonese': text,
+        'jyutping': " ".join(f"syl{rng.randint(1, 6)}" for _ in text),
+        'english': f"meaning of {text}",
+        'audio_rel_path': f"bench/{zlib.crc32(text.encode('utf-8')) % 997:03d}.mp3"
+    }
+
+
+def make_unit(index: int, rng: random.Random, pool: List[str]) -> Dict:
+    """One unit with SENTENCES_PER_UNIT sentences of 3-7 chunks"""
+    conversation = []
+    for i in range(SENTENCES_PER_UNIT):
+        chunks = [_chunk(rng, pool) for _ in range(rng.randint(3, 6))]
+        chunks.append({
+            'cantonese': rng.choice(PARTICLES),
+            'jyutping': "aa3",
+            'english': "(particle)",
+            'audio_rel_path': "bench/particle.mp3"
+        })
+        text = "".join(c['cantonese'] for c in chunks)
+        conversation.append({
+            'id': i,
+            'speaker': "AB"[i % 2],
+            'cantonese': text + "。",
+            'jyutping': " ".join(c['jyutping'] for c in chunks),
+            'english_natural': f"Sentence {i} of unit {index}",
+            'audio_rel_path': f"bench/s{index % 50:02d}_{i}.mp3",
+            'chunks': chunks
+        })
+    return {
+        'id': f"{1700000000 + index}_{index:06x}",
+        'title': f"Synthetic unit {index}",
+        'topic_description': f"Generated benchmark unit number {index}",
+        'topic': f"synthetic topic {index}",
+        'conversation': conversation
+    }
+
+
+def vocabulary_pool(rng: random.Random, size: int) -> List[str]:
+    """`size` distinct one- to three-character words"""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(CHARACTERS) for _ in range(rng.randint(1, 3))))
+    return sorted(words)
+
+
+def make_card(cantonese: str, rng: random.Random, now: float) -> Dict:
+    """A card scheduled somewhere between ten days ago and a month ahead"""
+    reps = rng.randint(0, 6)
+    return {
+        'cantonese': cantonese,
+        'jyutping': "syl1",
+        'english': f"meaning of {cantonese}",
+        'audio_rel_path': "bench/particle.mp3",
+        'learned_date': now - 86400 * 30,
+        'next_review': now + rng.uniform(-10, 30) * 86400,
+        'interval': rng.uniform(0, 20),
+        'reps': reps
+    }
+
+
+def write_audio_files(rng: random.Random) -> List[str]:
+    """Create the fake audio clips units point at; returns their rel paths"""
+    rel_paths = ["bench/particle.mp3"]
+    rel_paths += [f"bench/{i:03d}.mp3" for i in range(997)]
+    rel_paths += [f"bench/s{u:02d}_{i}.mp3" for u in range(50) for i in range(SENTENCES_PER_UNIT)]
+    os.makedirs(os.path.join(AUDIO_DIR, "bench"), exist_ok=True)
+    for rel_path in rel_paths:
+        with open(os.path.join(AUDIO_DIR, rel_path), 'wb') as f:
+            f.write(rng.randbytes(AUDIO_FILE_BYTES))
+    return rel_paths
+
+
+def seed(units: int, cards: int, progress: int, seed_value: int = 0) -> Dict:
+    """
+    Fill the configured storage backend with synthetic data
+
+    Run against an empty CANTO_DATA_ROOT; everything goes through the
+    storage API, so the same data works for every backend.
+
+    Args:
+        units: Number of units
+        cards: Number of vocab cards
+        progress: Number of lesson progress entries
+        seed_value: RNG seed, so runs are comparable
+
+    Returns:
+        Dict with the generated 'units', the 'words' pool and 'audio' paths
+    """
+    rng = random.Random(seed_value)
+    now = time.time()
+    storage = get_storage()
+    words = vocabulary_pool(rng, max(cards, 50))
+
+    generated = [make_unit(i, rng, words[:max(50, cards // 2)]) for i in range(units)]
+    for unit in generated:
+        storage.save_unit(unit)
+
+    storage.put_cards([make_card(word, rng, now) for word in words[:cards]])
+
+    lessons_per_unit = max(1, SENTENCES_PER_UNIT // LESSON_CHUNK_SIZE)
+    for i in range(progress):
+        unit = generated[i % len(generated)] if generated else {'id': 'none'}
+        lesson = (i // max(1, len(generated))) % lessons_per_unit + 1
+        storage.set_lesson_progress(
+            unit['id'], f"lesson_{lesson}", {'completed': rng.random() < 0.7, 'last_accessed': now}
+        )
+
+    return {'units': generated, 'words': words, 'audio': write_audio_files(rng)}
@@ -0,0 +1,73 @@
+"""
+Debug Panel
+Hidden sidebar view of profiling metrics and cache stats
+"""
+import streamlit as st
+from core.constants import DEBUG_PANEL
+from utils.profiling import get_profiler, export_json
+from utils.audio import get_audio_cache_stats
+from components.lesson_cache import get_lesson_cache_stats
+
+
+def is_debug_enabled() -> bool:
+    """Shown with CANTO_DEBUG=1 or ?debug=1 in the URL"""
+    return DEBUG_PANEL or st.query_params.get("debug") == "1"
+
+
+def render_debug_panel():
+    """Render timings, I/O counters and cache stats with a JSON export"""
+    if not is_debug_enabled():
+        return
+
+    profiler = get_profiler()
+    with st.expander("🛠️ Debug: performance", expanded=False):
+        if not profiler.enabled:
+            st.caption("Profiling is off (CANTO_PROFILE=0)")
+            return
+
+        snapshot = profiler.snapshot()
+
+        st.caption("Latency (ms)")
+        st.dataframe(
+            [
+                {
+                    'metric': name,
+                    'count': stats['count'],
+                    'p50': stats['p50_ms'],
+                    'p95': stats['p95_ms'],
+                    'max': stats['max_ms'],
+                    'total': stats['total_ms'],
+                }
+                for name, stats in snapshot['latency'].items()
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+
+        st.caption("I/O")
+        st.dataframe(
+            [
+                {'counter': name, 'ops': counter['ops'], 'KB': round(counter['bytes'] / 1024, 1)}
+                for name, counter in snapshot['io'].items()
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+
+        st.caption("Caches")
+        st.json({'audio': get_audio_cache_stats(), 'lesson_payload': get_lesson_cache_stats()},
+                expanded=False)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "⬇️ JSON",
+                data=export_json(),
+                file_name="canto_profile.json",
+                mime="application/json",
+                use_container_width=True
+            )
+        with col2:
+            if st.button("Reset", key="debug_reset", use_container_width=True):
+                profiler.reset()
+                st.rerun()
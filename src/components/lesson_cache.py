@@ -0,0 +1,69 @@
+"""
+Lesson Cache
+Memoizes playable lesson payloads built from the precompiled artifacts
+"""
+from typing import Dict
+from core.constants import AUDIO_DELIVERY, LESSON_CACHE_MAX_BYTES
+from services.payload_service import (
+    unit_content_hash, build_lesson_payload, read_lesson_payload, write_lesson_payload,
+    resolve_audio_refs
+)
+from utils.audio import get_audio_version
+from utils.cache import LRUCache
+from utils.profiling import profiled
+
+# Shared by all sessions; keys start with the unit id and content hash so
+# stale versions can be dropped
+_payload_cache = LRUCache(LESSON_CACHE_MAX_BYTES)
+
+
+@profiled('lesson.payload')
+def get_lesson_payload(unit: Dict, start: int, end: int, lesson_type: str = 'full') -> str:
+    """
+    Get the player payload for a lesson, building it only on a cache miss
+
+    A miss reads the lesson's precompiled payload (written by save_unit),
+    compiling it only if the artifact is missing or stale.
+
+    Entries are keyed by unit id, unit content hash, lesson range, lesson
+    type, audio delivery mode and the shared audio version. Both versions
+    come from persisted state, so a save_unit or regenerate_audio in any
+    process invalidates them.
+
+    Args:
+        unit: Unit dictionary
+        start: First sentence index
+        end: End sentence index (exclusive)
+        lesson_type: 'full' or 'quick'
+
+    Returns:
+        Slide payload JSON with playable audio sources
+    """
+    unit_id = unit.get('id')
+    content_hash = unit_content_hash(unit)
+    audio_version = get_audio_version()
+    key = (unit_id, content_hash, start, end, lesson_type, AUDIO_DELIVERY, audio_version)
+
+    payload = _payload_cache.get(key)
+    if payload is None:
+        # Drop entries for older versions of this unit or of the audio
+        _payload_cache.discard(
+            lambda k: (k[0] == unit_id and k[1] != content_hash) or k[-1] != audio_version
+        )
+        stored = read_lesson_payload(unit, start, end, lesson_type, content_hash)
+        if stored is None:
+            try:
+                stored = write_lesson_payload(unit, start, end, lesson_type, content_hash)
+            except OSError as e:
+                # The artifact is only a shortcut; serve the lesson without it
+                print(f"Error writing lesson payload for unit {unit_id}: {e}")
+                stored = build_lesson_payload(unit, start, end, lesson_type)
+        payload = resolve_audio_refs(stored)
+        _payload_cache.put(key, payload)
+
+    return payload
+
+
+def get_lesson_cache_stats() -> Dict:
+    """Hit/miss counters and size of the lesson cache"""
+    return _payload_cache.stats()
@@ -0,0 +1,729 @@
+// Lesson player, rendered as a Streamlit component (see components/player.py).
+// This file is static and cached by the browser; each render only sends the
+// slide payload and a few settings. Events (completion, grades) go back to
+// Python as the component value.
+
+let slides = [];
+let renderedPayload = null;
+let playerMode = 'lesson';
+let eventSeq = 0;
+let wavesurferUrl = null;
+let wavesurferLoad = null;
+let currentIdx = 0;
+let currentAudio = null;
+let wsTeacher = null;
+let wsStudent = null;
+let mediaRecorder = null;
+let audioChunks = [];
+let autoPlayTimeout = null;
+let studentRecordingBlob = null;
+let playToken = 0;
+
+// === STREAMLIT COMPONENT PROTOCOL ===
+// The subset of streamlit-component-lib the player needs, without a build step
+function sendToStreamlit(type, data) {
+    window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), '*');
+}
+
+// Each event gets a fresh id so Python sees a changed value every time
+function sendEvent(type, data) {
+    const value = Object.assign({ id: `${Date.now()}-${++eventSeq}`, type: type, slide: currentIdx }, data);
+    sendToStreamlit('streamlit:setComponentValue', { value: value, dataType: 'json' });
+}
+
+// === WAVEFORMS ===
+// wavesurfer.js is fetched on the first quiz slide from the configured URL
+function loadWaveSurfer() {
+    if (window.WaveSurfer) return Promise.resolve(true);
+    if (!wavesurferLoad) {
+        wavesurferLoad = new Promise(resolve => {
+            const script = document.createElement('script');
+            script.src = wavesurferUrl;
+            script.onload = () => resolve(true);
+            script.onerror = () => {
+                console.log('wavesurfer.js unavailable, waveforms disabled:', wavesurferUrl);
+                resolve(false);
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return wavesurferLoad;
+}
+
+// === AUDIO ENGINE ===
+// Clips are fetched and decoded once into AudioBuffers and played through
+// Web Audio, so replays and prefetched clips start without a decode, and
+// dialogue lines are scheduled back to back on the audio clock. Falls back
+// to <audio> where Web Audio is missing or a clip will not decode.
+const MAX_DECODED_CLIPS = 300;
+const DIALOGUE_GAP_SECONDS = 0.8;  // Pause between dialogue lines
+const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+const bufferCache = new Map();  // src -> Promise<AudioBuffer>, least recently used first
+let audioCtx = null;
+let activeSources = [];
+let clipTimers = [];
+
+function getAudioContext() {
+    if (!audioCtx && AudioContextClass) audioCtx = new AudioContextClass();
+    return audioCtx;
+}
+
+// Browsers keep the context suspended until the user interacts with the page
+document.addEventListener('pointerdown', () => {
+    const ctx = getAudioContext();
+    if (ctx && ctx.state === 'suspended') ctx.resume();
+}, true);
+
+function decodeClip(src) {
+    const ctx = getAudioContext();
+    if (!ctx) return Promise.reject(new Error('Web Audio unavailable'));
+
+    let pending = bufferCache.get(src);
+    if (pending) {
+        bufferCache.delete(src);
+    } else {
+        pending = fetch(src)
+            .then(r => {
+                if (!r.ok) throw new Error(`HTTP ${r.status} for ${src}`);
+                return r.arrayBuffer();
+            })
+            .then(data => ctx.decodeAudioData(data));
+        pending.catch(() => {
+            if (bufferCache.get(src) === pending) bufferCache.delete(src);
+        });
+    }
+    bufferCache.set(src, pending);
+    if (bufferCache.size > MAX_DECODED_CLIPS) bufferCache.delete(bufferCache.keys().next().value);
+    return pending;
+}
+
+function prefetchClips(srcs) {
+    srcs.filter(Boolean).forEach(src => decodeClip(src).catch(() => {}));
+}
+
+function prefetchSlide(slide) {
+    if (!slide) return;
+    const c = slide.content;
+    const items = c.items || [];
+    // Whole lines first: the dialogue autoplays them
+    prefetchClips(items.map(item => item.full_audio_src));
+    prefetchClips([c.audio_src]);
+    items.forEach(item => prefetchClips(item.chunks.map(ch => ch.audio_src)));
+    prefetchClips((c.target_pills || []).map(ch => ch.audio_src));
+}
+
+// Play `src` at audio-clock time `when` (0 for now). Resolves with
+// {startAt, duration} once scheduled (startAt is null for the <audio>
+// fallback, which only resolves once it starts at `when`), or null if
+// playback was superseded or failed; onEnd runs when it finishes
+function playClip(src, when, onEnd) {
+    const token = playToken;
+    return decodeClip(src).then(buffer => {
+        if (token !== playToken) return null;
+        const source = audioCtx.createBufferSource();
+        source.buffer = buffer;
+        source.connect(audioCtx.destination);
+        source.onended = () => {
+            activeSources = activeSources.filter(s => s !== source);
+            if (token === playToken && onEnd) onEnd();
+        };
+        const startAt = Math.max(when, audioCtx.currentTime);
+        source.start(startAt);
+        activeSources.push(source);
+        return { startAt: startAt, duration: buffer.duration };
+    }, e => {
+        if (token !== playToken) return null;
+        console.log('Web Audio unavailable for clip, using <audio>:', e);
+        // <audio> cannot be scheduled, so wait for `when` before starting it
+        const delay = audioCtx ? Math.max(0, when - audioCtx.currentTime) : 0;
+        return new Promise(resolve => clipTimers.push(setTimeout(resolve, delay * 1000)))
+            .then(() => token === playToken ? playElement(src, onEnd) : null);
+    });
+}
+
+function playElement(src, onEnd) {
+    const token = playToken;
+    return new Promise(resolve => {
+        const aud = new Audio(src);
+        currentAudio = aud;
+        aud.onended = () => {
+            if (token === playToken && onEnd) onEnd();
+        };
+        aud.addEventListener('loadedmetadata', () => resolve({ startAt: null, duration: aud.duration }), { once: true });
+        aud.addEventListener('error', () => {
+            resolve(null);
+            if (token === playToken && onEnd) onEnd();
+        }, { once: true });
+        aud.play().catch(console.log);
+    });
+}
+
+// Run `fn` `offset` seconds after a clip starts, in step with the audio clock
+function atClipTime(clip, offset, fn) {
+    const lead = clip.startAt === null ? 0 : clip.startAt - audioCtx.currentTime;
+    clipTimers.push(setTimeout(fn, Math.max(0, (lead + offset) * 1000)));
+}
+
+function stopAudio() {
+    playToken++;
+    clipTimers.forEach(clearTimeout);
+    clipTimers = [];
+    activeSources.forEach(source => {
+        try {
+            source.stop();
+        } catch (e) {
+            // Not started yet
+        }
+    });
+    activeSources = [];
+    if (currentAudio) {
+        currentAudio.pause();
+        currentAudio = null;
+    }
+}
+
+function showTeacherWave(src) {
+    if (wsTeacher && document.getElementById('ws-teacher')) {
+        wsTeacher.load(src);
+        wsTeacher.play();
+    }
+}
+
+// === HIGHLIGHTING SYSTEM ===
+window.highlightPair = (sIdx, cIdx, active) => {
+    const cantoId = `c_${sIdx}_${cIdx}`;
+    const engId = `e_${sIdx}_${cIdx}`;
+
+    const cEl = document.getElementById(cantoId);
+    const eEl = document.getElementById(engId);
+
+    if (cEl) {
+        if (active) {
+            cEl.classList.add('active');
+        } else {
+            cEl.classList.remove('active');
+        }
+    }
+
+    if (eEl) {
+        if (active) {
+            eEl.classList.add('active');
+        } else {
+            eEl.classList.remove('active');
+        }
+    }
+};
+
+// === RENDERING FUNCTIONS ===
+function renderCantoPills(chunks, sIdx, isInteractive) {
+    return chunks.map((c, cIdx) => {
+        const styleVars = `--active-color:${c.color}; --active-bg:${c.color}20; --active-shadow:${c.color}40;`;
+        const style = `${styleVars} border-color:${c.color}30; color:${c.color};`;
+        const mouseEvt = `onmouseenter="highlightPair('${sIdx}', ${cIdx}, true)" onmouseleave="highlightPair('${sIdx}', ${cIdx}, false)"`;
+        const clickEvt = isInteractive && c.audio_src ? `onclick="playAudio('${c.audio_src}', null, ${cIdx}, ${sIdx})"` : '';
+
+        return `<span id="c_${sIdx}_${cIdx}" class="chunk-pill" style="${style}" ${mouseEvt} ${clickEvt}>
+            <span class="canto-text">${c.cantonese}</span>
+            <span class="jyutping">${c.jyutping}</span>
+        </span>`;
+    }).join('');
+}
+
+function renderEnglishRow(chunks, sIdx) {
+    const pills = chunks.map((c, cIdx) => {
+        const vars = `--hl-text:${c.color}; --hl-bg:${c.color}20; --hl-border:${c.color}; --hl-shadow:${c.color}40;`;
+        const mouseEvt = `onmouseenter="highlightPair('${sIdx}', ${cIdx}, true)" onmouseleave="highlightPair('${sIdx}', ${cIdx}, false)"`;
+
+        return `<span id="e_${sIdx}_${cIdx}" class="eng-chunk" style="${vars}" ${mouseEvt}>
+            ${c.english}
+        </span>`;
+    }).join('');
+
+    return `<div class="eng-row">
+        <span class="eng-label">Literal:</span>
+        ${pills}
+    </div>`;
+}
+
+function renderNaturalRow(text) {
+    if (!text) return '';
+    return `<div class="natural-row">
+        <span class="natural-icon">💬</span>
+        <span class="natural-text">${text}</span>
+    </div>`;
+}
+
+// === DIALOGUE RENDERING ===
+function renderDialogue(content) {
+    let html = '<div class="slide-enter" style="padding-bottom: 50px;">';
+
+    if (slides[currentIdx].type === 'intro_dialogue') {
+        html += `<div style="text-align:center; margin-bottom:24px;">
+            <button class="btn-reveal" onclick="startDialogueAutoPlay()" style="background: var(--primary-color);">
+                ↻ Replay Conversation
+            </button>
+        </div>`;
+    }
+
+    content.items.forEach((sent, sIdx) => {
+        html += `<div class="dialogue-row" id="row_${sIdx}">
+            <div class="speaker-col">
+                <div class="speaker-label">${sent.speaker}</div>
+                <div class="spk-btn" onclick="playRow(${sIdx})">🔊</div>
+            </div>
+            <div style="flex-grow:1">
+                <div>${renderCantoPills(sent.chunks, sIdx, true)}</div>
+                ${renderEnglishRow(sent.chunks, sIdx)}
+                ${renderNaturalRow(sent.english_natural)}
+            </div>
+        </div>`;
+    });
+
+    html += '</div>';
+    document.getElementById('app').innerHTML = html;
+    document.getElementById('app').scrollTop = 0;
+
+    window.playRow = (sIdx) => {
+        const sent = content.items[sIdx];
+        playSentenceWithHighlight(sent.full_audio_src, sent.chunks, sIdx);
+    };
+
+    window.startDialogueAutoPlay = () => {
+        if (autoPlayTimeout) clearTimeout(autoPlayTimeout);
+        stopAudio();
+        playDialogueSequence(content.items, 0);
+    };
+
+    autoPlayTimeout = setTimeout(window.startDialogueAutoPlay, 500);
+}
+
+// === QUIZ RENDERING ===
+function renderQuiz(content) {
+    let ctxHtml = content.context.map(c => 
+        `<span style="margin-right:8px; opacity:0.6">${c.cantonese}</span>`
+    ).join('');
+
+    let html = `
+    <div class="slide-enter">
+        <div class="quiz-header">
+            <div class="quiz-context">${ctxHtml}</div>
+            <div class="quiz-prompt">
+                How do you say:
+                <span>"${content.target_english}"</span>
+            </div>
+        </div>
+
+        <div style="text-align:center; margin-bottom:24px;">
+            <button class="btn-rec" id="recBtn" onclick="toggleRecord()">
+                <span>🎤</span>
+                <span id="recText">Record Your Answer</span>
+            </button>
+        </div>
+
+        <div style="text-align:center;" id="revealArea">
+            <button class="btn-reveal" onclick="revealAnswer()">👁 Reveal Answer</button>
+        </div>
+
+        <div id="ansContainer" class="answer-container">
+            <div class="answer-box">
+                <div style="margin-bottom:16px;">
+                    ${renderCantoPills(content.target_pills, 0, true)}
+                </div>
+                <div style="text-align:left">
+                    ${renderEnglishRow(content.target_pills, 0)}
+                    ${renderNaturalRow(content.target_english)}
+                </div>
+            </div>
+
+            <div class="wave-box">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
+                    <div class="wave-label" style="color:#ef4444; margin-bottom: 0;">You</div>
+                    <button class="nav-btn" onclick="playStudentRecording()" style="padding: 6px 16px; font-size: 0.85em;">
+                        ▶️ Play
+                    </button>
+                </div>
+                <div id="ws-student"></div>
+            </div>
+
+            <div class="wave-box" style="border-color:#93c5fd;">
+                <div class="wave-label" style="color:#2563eb">Teacher</div>
+                <div id="ws-teacher"></div>
+            </div>
+
+            <div style="text-align:center; margin-top:20px;">
+                <button class="btn-reveal" onclick="playAudio('${content.audio_src}')" style="background: var(--primary-color);">
+                    🔊 Replay Teacher
+                </button>
+            </div>
+        </div>
+    </div>`;
+
+    document.getElementById('app').innerHTML = html;
+    document.getElementById('app').scrollTop = 0;
+
+    loadWaveSurfer().then(available => {
+        // Waveforms are optional; the quiz works without them
+        if (!available) return;
+        destroyWaveforms();  // In case the slide changed while the library loaded
+        console.log('Initializing waveforms...');
+        if (document.getElementById('ws-student')) {
+            wsStudent = WaveSurfer.create({
+                container: '#ws-student',
+                waveColor: '#fca5a5',
+                progressColor: '#ef4444',
+                height: 60,
+                barWidth: 2,
+                barGap: 1,
+                normalize: true,
+                backend: 'WebAudio',
+                interact: true,
+                cursorWidth: 2,
+                cursorColor: '#991b1b'
+            });
+
+            // Enable interaction after loading
+            wsStudent.on('ready', () => {
+                console.log('Student waveform ready - click to play/seek');
+            });
+
+            // Click anywhere to seek and play
+            wsStudent.on('interaction', () => {
+                if (!wsStudent.isPlaying()) {
+                    wsStudent.play();
+                }
+            });
+
+            console.log('Student waveform created');
+        }
+        if (document.getElementById('ws-teacher')) {
+            wsTeacher = WaveSurfer.create({
+                container: '#ws-teacher',
+                waveColor: '#93c5fd',
+                progressColor: '#2563eb',
+                height: 60,
+                barWidth: 2,
+                barGap: 1,
+                normalize: true,
+                backend: 'WebAudio'
+            });
+            console.log('Teacher waveform created');
+        }
+    });
+}
+
+// === AUDIO PLAYBACK WITH WORD HIGHLIGHTING ===
+function setChunkActive(rowIndex, chunkIndex, active) {
+    const cEl = document.getElementById(`c_${rowIndex}_${chunkIndex}`);
+    const eEl = document.getElementById(`e_${rowIndex}_${chunkIndex}`);
+    if (cEl) cEl.classList.toggle('active', active);
+    if (eEl) eEl.classList.toggle('active', active);
+}
+
+function playAudio(src, onEnd, chunkIndex = null, rowIndex = null) {
+    stopAudio();
+
+    if (!src) {
+        if (onEnd) onEnd();
+        return;
+    }
+
+    // Highlight specific chunk if provided
+    const highlight = chunkIndex !== null && rowIndex !== null;
+    playClip(src, 0, () => {
+        if (highlight) setChunkActive(rowIndex, chunkIndex, false);
+        if (onEnd) onEnd();
+    }).then(clip => {
+        if (!clip) return;
+        showTeacherWave(src);
+        if (highlight) atClipTime(clip, 0, () => setChunkActive(rowIndex, chunkIndex, true));
+    });
+}
+
+// === SENTENCE AUDIO WITH WORD-BY-WORD HIGHLIGHTING ===
+function playSentenceWithHighlight(src, chunks, rowIndex, onEnd) {
+    stopAudio();
+
+    if (!src) {
+        if (onEnd) onEnd();
+        return;
+    }
+
+    playClip(src, 0, () => {
+        // Clear all highlights
+        chunks.forEach((_, idx) => setChunkActive(rowIndex, idx, false));
+        if (onEnd) onEnd();
+    }).then(clip => {
+        if (!clip) return;
+        showTeacherWave(src);
+        highlightChunks(chunks, rowIndex, clip);
+    });
+}
+
+// Highlight each chunk in sequence (rough estimate: equal share of the clip)
+function highlightChunks(chunks, rowIndex, clip) {
+    const timePerChunk = clip.duration / chunks.length;
+    chunks.forEach((_, idx) => setChunkActive(rowIndex, idx, false));
+    chunks.forEach((_, idx) => {
+        atClipTime(clip, timePerChunk * idx, () => {
+            if (idx > 0) setChunkActive(rowIndex, idx - 1, false);
+            setChunkActive(rowIndex, idx, true);
+        });
+    });
+}
+
+// === AUTO-PLAY DIALOGUE ===
+function scrollToCenter(el) {
+    const container = document.getElementById('app');
+    const elRect = el.getBoundingClientRect();
+    const containerRect = container.getBoundingClientRect();
+    const relativeTop = elRect.top - containerRect.top;
+    const target = container.scrollTop + relativeTop - (containerRect.height / 2) + (elRect.height / 2);
+    container.scrollTo({ top: target, behavior: 'smooth' });
+}
+
+function showPlayingRow(index) {
+    document.querySelectorAll('.dialogue-row').forEach(r => r.classList.remove('playing'));
+
+    const activeRow = document.getElementById(`row_${index}`);
+    if (activeRow) {
+        activeRow.classList.add('playing');
+        scrollToCenter(activeRow);
+    }
+}
+
+// Each line is scheduled on the audio clock to start DIALOGUE_GAP_SECONDS
+// after the previous one ends, as soon as that one is scheduled, so the next
+// line is already decoded and queued when its turn comes
+function playDialogueSequence(items, index, when = 0) {
+    if (index >= items.length) return;
+    const src = items[index].full_audio_src;
+    if (!src) {
+        playDialogueSequence(items, index + 1, when);
+        return;
+    }
+
+    let scheduledNext = false;
+    playClip(src, when, () => {
+        // <audio> fallback: chain on the end of the line instead
+        if (!scheduledNext) {
+            autoPlayTimeout = setTimeout(() => playDialogueSequence(items, index + 1), DIALOGUE_GAP_SECONDS * 1000);
+        }
+    }).then(clip => {
+        if (!clip) return;
+        atClipTime(clip, 0, () => showPlayingRow(index));
+        if (clip.startAt !== null) {
+            scheduledNext = true;
+            playDialogueSequence(items, index + 1, clip.startAt + clip.duration + DIALOGUE_GAP_SECONDS);
+        }
+    });
+}
+
+// === RECORDING ===
+window.toggleRecord = async () => {
+    const btn = document.getElementById('recBtn');
+    const txt = document.getElementById('recText');
+
+    if (!mediaRecorder || mediaRecorder.state === "inactive") {
+        try {
+            const stream = await navigator.mediaDevices.getUserMedia({ 
+                audio: {
+                    echoCancellation: true,
+                    noiseSuppression: true,
+                    sampleRate: 44100
+                }
+            });
+
+            mediaRecorder = new MediaRecorder(stream, {
+                mimeType: 'audio/webm'
+            });
+            audioChunks = [];
+
+            mediaRecorder.ondataavailable = e => {
+                if (e.data.size > 0) {
+                    audioChunks.push(e.data);
+                    console.log('Audio chunk received:', e.data.size, 'bytes');
+                }
+            };
+
+            mediaRecorder.onstop = () => {
+                console.log('Recording stopped, chunks:', audioChunks.length);
+                const blob = new Blob(audioChunks, { type: 'audio/webm' });
+                console.log('Blob created:', blob.size, 'bytes');
+                studentRecordingBlob = blob;
+
+                if (wsStudent && blob.size > 0) {
+                    console.log('Loading blob into waveform...');
+                    wsStudent.loadBlob(blob);
+                } else {
+                    console.error('No waveform or empty blob');
+                }
+
+                stream.getTracks().forEach(t => t.stop());
+            };
+
+            mediaRecorder.start();
+            console.log('Recording started');
+            btn.classList.add("recording");
+            txt.innerText = "Stop Recording";
+        } catch(e) {
+            console.error('Microphone error:', e);
+            alert("Microphone Error: " + e.message + "\n\nPlease allow microphone access and try again.");
+        }
+    } else {
+        console.log('Stopping recording...');
+        mediaRecorder.stop();
+        btn.classList.remove("recording");
+        txt.innerText = "Record Your Answer";
+    }
+};
+
+window.playStudentRecording = () => {
+    if (wsStudent) {
+        wsStudent.play();
+    }
+};
+
+window.revealAnswer = () => {
+    document.getElementById('revealArea').style.display = 'none';
+    document.getElementById('ansContainer').classList.add('visible');
+    setTimeout(() => {
+        document.getElementById('ansContainer').scrollIntoView({ behavior: 'smooth' });
+    }, 100);
+    const content = slides[currentIdx].content;
+    playSentenceWithHighlight(content.audio_src, content.target_pills, 0);
+};
+
+// === SLIDE NAVIGATION ===
+function stopPlayback() {
+    if (autoPlayTimeout) clearTimeout(autoPlayTimeout);
+    stopAudio();
+    stopRecording();
+    destroyWaveforms();
+}
+
+// Discard an unfinished recording and release the microphone
+function stopRecording() {
+    if (!mediaRecorder) return;
+    mediaRecorder.ondataavailable = null;
+    mediaRecorder.onstop = null;
+    if (mediaRecorder.state !== 'inactive') mediaRecorder.stop();
+    mediaRecorder.stream.getTracks().forEach(t => t.stop());
+    mediaRecorder = null;
+}
+
+function destroyWaveforms() {
+    if (wsStudent) wsStudent.destroy();
+    if (wsTeacher) wsTeacher.destroy();
+    wsStudent = null;
+    wsTeacher = null;
+}
+
+function renderSlide(s) {
+    prefetchSlide(s);
+    if (s.type === 'intro_dialogue' || s.type === 'analysis') {
+        renderDialogue(s.content);
+    } else {
+        renderQuiz(s.content);
+    }
+    // Decode the next slide's audio while this one is on screen
+    prefetchSlide(slides[currentIdx + 1]);
+}
+
+window.changeSlide = (delta) => {
+    stopPlayback();
+
+    const newIdx = currentIdx + delta;
+    if (newIdx < 0 || newIdx >= slides.length) return;
+
+    currentIdx = newIdx;
+
+    const progEl = document.getElementById('progress');
+    if (progEl) progEl.innerText = `${currentIdx + 1} / ${slides.length}`;
+
+    const prevEl = document.getElementById('prevBtn');
+    if (prevEl) prevEl.disabled = (currentIdx === 0);
+
+    const nextEl = document.getElementById('nextBtn');
+    if (nextEl) {
+        if (currentIdx === slides.length - 1) {
+            nextEl.innerText = 'Finish ✓';
+            nextEl.onclick = () => {
+                nextEl.disabled = true;
+                sendEvent('complete');
+            };
+        } else {
+            nextEl.innerText = 'Next →';
+            nextEl.onclick = () => changeSlide(1);
+        }
+    }
+
+    renderSlide(slides[currentIdx]);
+};
+
+// === REVIEW MODE ===
+// Python sends the next few due cards; grading moves to the next one at once
+// and reports every grade so far, so none is lost if reruns coalesce
+let reviewCards = [];
+let shownCard = null;
+const gradedCards = new Set();
+const grades = [];
+
+function applyReviewBatch(batchSlides, cardIds) {
+    reviewCards = cardIds
+        .map((card, i) => ({ card: card, slide: batchSlides[i] }))
+        .filter(c => !gradedCards.has(c.card));
+    // Keep the card on screen (revealed answer, recording) if it is still first
+    if (reviewCards.length && reviewCards[0].card === shownCard) return;
+    showReviewCard();
+}
+
+function showReviewCard() {
+    stopPlayback();
+    slides = reviewCards.map(c => c.slide);
+    currentIdx = 0;
+    shownCard = reviewCards.length ? reviewCards[0].card : null;
+    document.getElementById('gradeBar').classList.toggle('waiting', !shownCard);
+
+    if (!shownCard) {
+        document.getElementById('app').innerHTML =
+            '<div class="review-waiting slide-enter">Loading more cards…</div>';
+        return;
+    }
+    reviewCards.slice(1).forEach(c => prefetchSlide(c.slide));
+    renderSlide(slides[0]);
+}
+
+window.gradeCard = (quality) => {
+    if (!shownCard) return;
+    gradedCards.add(shownCard);
+    grades.push({ id: `${Date.now()}-${grades.length}`, card: shownCard, quality: quality });
+    sendEvent('grade', { grades: grades });
+    reviewCards.shift();
+    showReviewCard();
+};
+
+// === INITIALIZATION ===
+window.addEventListener('message', event => {
+    const data = event.data;
+    if (!data || data.type !== 'streamlit:render') return;
+
+    const args = data.args;
+    playerMode = args.mode;
+    document.body.classList.toggle('review-mode', playerMode === 'review');
+    wavesurferUrl = args.wavesurfer_url;
+    sendToStreamlit('streamlit:setFrameHeight', { height: args.height });
+
+    // Every rerun sends the args again; only a new payload restarts the player
+    if (args.slides === renderedPayload) return;
+    renderedPayload = args.slides;
+
+    if (playerMode === 'review') {
+        applyReviewBatch(JSON.parse(args.slides), args.cards);
+        return;
+    }
+    slides = JSON.parse(args.slides);
+    currentIdx = 0;
+    changeSlide(0);
+});
+
+sendToStreamlit('streamlit:componentReady', { apiVersion: 1 });
@@ -5,10 +5,36 @@ import os
 
 # Directories
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = os.path.join(BASE_DIR, "data", "units")
-AUDIO_DIR = os.path.join(BASE_DIR, "assets", "audio")
-VOCAB_PATH = os.path.join(BASE_DIR, "data", "vocab.json")
-PROGRESS_PATH = os.path.join(BASE_DIR, "data", "progress.json")
+# Root for data/ and assets/audio/ (CANTO_DATA_ROOT points benchmarks and
+# tests at a scratch directory)
+DATA_ROOT = os.getenv("CANTO_DATA_ROOT", BASE_DIR)
+DATA_DIR = os.path.join(DATA_ROOT, "data", "units")
+AUDIO_DIR = os.path.join(DATA_ROOT, "assets", "audio")
+SHARED_AUDIO_SUBDIR = "shared"  # Content-addressed TTS blobs under AUDIO_DIR
+VOCAB_PATH = os.path.join(DATA_ROOT, "data", "vocab.json")
+PROGRESS_PATH = os.path.join(DATA_ROOT, "data", "progress.json")
+VOCAB_JOURNAL_PATH = os.path.join(DATA_ROOT, "data", "vocab.journal")
+PROGRESS_JOURNAL_PATH = os.path.join(DATA_ROOT, "data", "progress.journal")
+UNIT_INDEX_PATH = os.path.join(DATA_ROOT, "data", "units_index.json")
+DB_PATH = os.path.join(DATA_ROOT, "data", "canto.db")
+JOBS_PATH = os.path.join(DATA_ROOT, "data", "jobs.json")
+# Counter bumped whenever shared audio blobs are rewritten in place
+AUDIO_VERSION_PATH = os.path.join(DATA_ROOT, "data", "audio_version.json")
+JYUTPING_CACHE_PATH = os.path.join(DATA_ROOT, "data", "jyutping_cache.jsonl")
+PAYLOAD_DIR = os.path.join(DATA_ROOT, "data", "payloads")  # Precompiled lesson payloads
+
+# Storage backend: 'json' (files under data/) or 'sqlite' (DB_PATH)
+STORAGE_BACKEND = os.getenv("CANTO_STORAGE", "json")
+
+# Audio delivery: 'inline' embeds base64 in the player HTML, 'url' references
+# files over HTTP. AUDIO_BASE_URL points 'url' mode at an existing server
+# (e.g. Streamlit static serving); when empty a local audio server is started.
+AUDIO_DELIVERY = os.getenv("CANTO_AUDIO_DELIVERY", "inline")
+AUDIO_BASE_URL = os.getenv("CANTO_AUDIO_BASE_URL", "")
+AUDIO_SERVER_HOST = os.getenv("CANTO_AUDIO_HOST", "127.0.0.1")
+AUDIO_SERVER_PORT = int(os.getenv("CANTO_AUDIO_PORT", "8765"))
+AUDIO_CACHE_MAX_BYTES = 64 * 1024 * 1024  # In-memory base64 audio cache
+LESSON_CACHE_MAX_BYTES = 128 * 1024 * 1024  # Playable player payloads per lesson
 
 # UI Colors - Modern, vibrant palette
 COLORS = {
@@ -28,6 +54,30 @@ VOICES = {
     'B': 'zh-HK-WanLungNeural',  # Male voice
 }
 
+# TTS engine: 'edge' (Edge neural voices, online) or 'tone' (offline,
+# deterministic tones for tests and benchmarks). See generators/tts_providers.py
+TTS_PROVIDER = os.getenv("CANTO_TTS_PROVIDER", "edge")
+
+# TTS generation
+TTS_CONCURRENCY = 8      # Simultaneous TTS requests
+TTS_MAX_RETRIES = 3      # Retries per file after the first attempt
+TTS_TIMEOUT = 30.0       # Seconds per attempt
+TTS_BACKOFF_BASE = 0.5   # First retry delay in seconds, doubled each retry
+
+# Background unit generation
+JOB_CONCURRENCY = 2      # Units generated at the same time
+JOB_HISTORY = 20         # Finished jobs kept in JOBS_PATH
+JOB_POLL_SECONDS = 2.0   # Library refresh interval while jobs are active
+JOB_HEARTBEAT_SECONDS = 10.0  # How often a process marks its active jobs alive
+JOB_STALE_SECONDS = 60.0      # Active jobs without a heartbeat this long are taken over
+# Load openai/pycantonese in the background once the library is shown
+GENERATION_WARMUP = os.getenv("CANTO_WARMUP", "1") != "0"
+
+# Profiling: timings and I/O counters (utils/profiling.py). The sidebar debug
+# panel is hidden unless CANTO_DEBUG=1 or the URL has ?debug=1
+PROFILING_ENABLED = os.getenv("CANTO_PROFILE", "1") != "0"
+DEBUG_PANEL = os.getenv("CANTO_DEBUG", "0") == "1"
+
 # Learning Settings
 LESSON_CHUNK_SIZE = 1  # Sentences per lesson
 SRS_INTERVALS = {
@@ -35,11 +85,20 @@ SRS_INTERVALS = {
     'good': 1.5,     # Multiplier
     'easy': 2.0,     # Multiplier
 }
+VOCAB_COMPACT_EVERY = 500  # Journal entries before vocab.json is rewritten
+PROGRESS_FLUSH_DELAY = 2.0  # Seconds of quiet before buffered progress is written
 
 # UI Settings
 PLAYER_HEIGHT = 850
-PLAYER_HEIGHT_SRS = 550
+PLAYER_HEIGHT_REVIEW = 640  # Review card plus the grade bar
+REVIEW_PRELOAD_CARDS = 5  # Due cards sent to the review player at a time
+# wavesurfer.js for the quiz waveforms. Empty uses a copy saved at
+# components/player_frontend/vendor/wavesurfer.min.js if there is one
+# (offline deployments), otherwise WAVESURFER_CDN_URL
+WAVESURFER_URL = os.getenv("CANTO_WAVESURFER_URL", "")
+WAVESURFER_CDN_URL = "https://unpkg.com/wavesurfer.js@7.5.3/dist/wavesurfer.min.js"
 SIDEBAR_WIDTH = 300
+LIBRARY_PAGE_SIZE = 12  # Unit cards per library page
 
 # Punctuation (exclude from vocab)
 PUNCTUATION = {'。', '，', '？', '！', '.', ',', '?', '!', '；', '：', ';', ':'}
\ No newline at end of file
@@ -12,9 +12,12 @@ def init_session_state():
         'current_unit': None,
         'lesson_range': None,
         'lesson_key': None,
+        'lesson_completed': False,
         'srs_queue': [],
         'audio_autoplay': True,
         'show_jyutping': False,
+        'library_page': 0,
+        'library_query': '',
     }
 
     for key, default_value in defaults.items():
@@ -1,15 +1,19 @@
 """
 Audio Generator
-Generate TTS audio for unit content using edge-tts
+Generate TTS audio for unit content with the configured TTS provider
 """
-import asyncio
+import hashlib
+import json
 import os
-import edge_tts
+from typing import Dict, List, Optional, Tuple
 from core.constants import VOICES
-from utils.audio import ensure_audio_dir
+from utils.audio import shared_audio_path, bump_audio_version
+from generators.tts_providers import TTSProvider, get_tts_provider
+from generators.tts_scheduler import TTSJob, TTSReport, TTSScheduler
 
 
-async def generate_audio_file(text: str, filepath: str, voice: str):
+async def generate_audio_file(text: str, filepath: str, voice: str,
+                              provider: Optional[TTSProvider] = None):
     """
     Generate a single audio file using TTS
 
@@ -17,57 +21,146 @@ async def generate_audio_file(text: str, filepath: str, voice: str):
         text: Text to synthesize
         filepath: Output file path
         voice: Voice identifier (e.g., "zh-HK-HiuGaaiNeural")
+        provider: TTS engine (defaults to the TTS_PROVIDER one)
+
+    Raises:
+        Exception: Whatever the TTS service raised; TTSScheduler retries it
     """
-    try:
-        communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(filepath)
-    except Exception as e:
-        print(f"Error generating audio {filepath}: {e}")
+    await (provider or get_tts_provider()).synthesize(text, filepath, voice)
 
 
-async def generate_unit_audio(unit_data: dict, unit_id: str):
+def utterance_key(text: str, voice: str, params: Optional[Dict] = None) -> str:
     """
-    Generate all audio files for a unit
+    Content address of an utterance: same text, voice and params -> same audio
 
     Args:
-        unit_data: Unit dictionary with conversation data
-        unit_id: Unique unit identifier
+        text: Text to synthesize
+        voice: Voice identifier
+        params: TTS engine parameters (defaults to the TTS_PROVIDER ones)
+
+    Returns:
+        Hex digest used as the shared audio filename
+    """
+    if params is None:
+        params = get_tts_provider().params
+    encoded = json.dumps([text.strip(), voice, params], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:32]
+
+
+def create_scheduler(provider: Optional[TTSProvider] = None, **kwargs) -> TTSScheduler:
+    """
+    Create a TTS scheduler for one provider
+
+    Args:
+        provider: TTS engine (defaults to the TTS_PROVIDER one)
+        **kwargs: TTSScheduler limit overrides
+
+    Returns:
+        Scheduler bound to the provider
+    """
+    provider = provider or get_tts_provider()
+
+    async def synthesize(text: str, filepath: str, voice: str):
+        await generate_audio_file(text, filepath, voice, provider)
+
+    return TTSScheduler(synthesize, provider=provider, **kwargs)
+
+
+def plan_sentence_audio(sentence: Dict, provider: TTSProvider, queued: Dict[str, TTSJob],
+                        force: bool = False) -> Tuple[List[TTSJob], int]:
+    """
+    Point a sentence and its chunks at shared audio blobs
+
+    Sets 'audio_rel_path' on the sentence and every chunk, and works out
+    which blobs still need synthesizing.
+
+    Args:
+        sentence: Conversation sentence with its chunks
+        provider: TTS engine the audio will come from
+        queued: Jobs already planned in this run, by rel_path (updated in place)
+        force: Re-synthesize blobs that already exist
+
+    Returns:
+        (new jobs to run, number of utterances reused)
+    """
+    voice = VOICES.get(sentence.get('speaker', 'A'), VOICES['A'])
+    new_jobs = []
+    cached = 0
+
+    # Sentence audio, then chunk audio
+    for item in [sentence] + sentence.get('chunks', []):
+        key = utterance_key(item['cantonese'], voice, provider.params)
+        rel_path, full_path = shared_audio_path(key, provider.extension)
+        item['audio_rel_path'] = rel_path
+
+        if rel_path in queued or (not force and os.path.exists(full_path)):
+            cached += 1
+        else:
+            queued[rel_path] = TTSJob(item['cantonese'], full_path, voice)
+            new_jobs.append(queued[rel_path])
+
+    return new_jobs, cached
+
+
+def print_report(report: TTSReport):
+    """Print a TTS run summary and any failed files"""
+    print(f"🔊 {report.summary()}")
+    for failure in report.failed:
+        print(f"   ✗ {failure['filepath']}: {failure['error']}")
+
+
+async def generate_unit_audio(unit_data: dict, unit_id: str,
+                              scheduler: Optional[TTSScheduler] = None,
+                              force: bool = False) -> TTSReport:
     """
-    audio_dir = ensure_audio_dir(unit_id)
-    tasks = []
+    Generate all audio files for a unit
 
-    for s_idx, sentence in enumerate(unit_data['conversation']):
-        speaker = sentence.get('speaker', 'A')
-        voice = VOICES.get(speaker, VOICES['A'])
+    Audio is content-addressed: every sentence and chunk points at a shared
+    blob named by utterance_key(), so text already spoken by the same voice
+    anywhere in the library is reused instead of synthesized again.
 
-        # Generate sentence audio
-        s_filename = f"sent_{s_idx}.mp3"
-        s_path = os.path.join(audio_dir, s_filename)
-        sentence['audio_rel_path'] = f"{unit_id}/{s_filename}"
+    Args:
+        unit_data: Unit dictionary with conversation data
+        unit_id: Unique unit identifier (audio itself is shared, not per unit)
+        scheduler: Shared scheduler to run on (a default one is created if omitted)
+        force: Re-synthesize blobs that already exist
 
-        tasks.append(generate_audio_file(sentence['cantonese'], s_path, voice))
+    Returns:
+        TTSReport listing any files that could not be generated
+    """
+    scheduler = scheduler or create_scheduler()
+    provider = scheduler.provider or get_tts_provider()
 
-        # Generate chunk audio
-        for c_idx, chunk in enumerate(sentence.get('chunks', [])):
-            c_filename = f"chunk_{s_idx}_{c_idx}.mp3"
-            c_path = os.path.join(audio_dir, c_filename)
-            chunk['audio_rel_path'] = f"{unit_id}/{c_filename}"
+    queued: Dict[str, TTSJob] = {}
+    cached = 0
+    for sentence in unit_data['conversation']:
+        cached += plan_sentence_audio(sentence, provider, queued, force)[1]
 
-            tasks.append(generate_audio_file(chunk['cantonese'], c_path, voice))
+    # Generate missing audio with bounded concurrency
+    report = await scheduler.run(list(queued.values()))
+    report.cached = cached
 
-    # Generate all audio in parallel
-    await asyncio.gather(*tasks)
+    print_report(report)
+    return report
 
 
-async def regenerate_audio(unit_data: dict):
+async def regenerate_audio(unit_data: dict) -> TTSReport:
     """
     Regenerate audio for an existing unit
 
+    The unit's blobs are rewritten in place, so the shared audio version is
+    bumped to rebuild lessons of every unit that uses them.
+
     Args:
         unit_data: Unit dictionary
+
+    Returns:
+        TTSReport for the regenerated files
     """
     unit_id = unit_data.get('id')
     if not unit_id:
         raise ValueError("Unit must have an 'id' field")
 
-    await generate_unit_audio(unit_data, unit_id)
\ No newline at end of file
+    report = await generate_unit_audio(unit_data, unit_id, force=True)
+    bump_audio_version()
+    return report
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+Batch Generator
+Generate units for every topic in a file, several at a time
+
+    python -m generators.batch_cli topics.txt --llm-concurrency 4 --tts-concurrency 16
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import Dict, List, Set
+from core.constants import TTS_CONCURRENCY
+from services.unit_service import get_unit_summaries
+from generators.audio_generator import create_scheduler
+from generators.content_generator import build_unit
+
+
+def read_topics(path: str) -> List[str]:
+    """
+    Read topics, one per line
+
+    Blank lines and lines starting with '#' are ignored, as are repeats.
+
+    Args:
+        path: Topics file
+
+    Returns:
+        Topics in file order
+    """
+    topics = []
+    seen = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            topic = line.strip()
+            if topic and not topic.startswith('#') and topic not in seen:
+                seen.add(topic)
+                topics.append(topic)
+    return topics
+
+
+def existing_topics() -> Set[str]:
+    """Topics of units already in the library, read from the unit index"""
+    return {summary['topic'] for summary in get_unit_summaries() if summary.get('topic')}
+
+
+async def generate_batch(topics: List[str], llm_concurrency: int = 4,
+                         tts_concurrency: int = TTS_CONCURRENCY) -> Dict:
+    """
+    Build units for all topics concurrently
+
+    Every build runs at once; a semaphore caps simultaneous LLM streams and
+    one shared scheduler caps TTS requests across all of them. A failed
+    topic is reported and does not stop the others.
+
+    Args:
+        topics: Topics to generate
+        llm_concurrency: Maximum completions streaming at the same time
+        tts_concurrency: Maximum TTS requests in flight across all units
+
+    Returns:
+        Dict with 'succeeded' unit ids, 'failed' {topic: error} and 'elapsed' seconds
+    """
+    llm_limit = asyncio.Semaphore(llm_concurrency)
+    scheduler = create_scheduler(concurrency=tts_concurrency)
+    start = time.perf_counter()
+
+    results = await asyncio.gather(
+        *(build_unit(topic, scheduler=scheduler, llm_limit=llm_limit) for topic in topics),
+        return_exceptions=True
+    )
+
+    summary = {'succeeded': [], 'failed': {}, 'elapsed': time.perf_counter() - start}
+    for topic, result in zip(topics, results):
+        if isinstance(result, BaseException):
+            summary['failed'][topic] = f"{type(result).__name__}: {result}"
+        else:
+            summary['succeeded'].append(result['id'])
+    return summary
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate units for every topic in a file")
+    parser.add_argument('topics_file', help="Text file with one topic per line")
+    parser.add_argument('--llm-concurrency', type=int, default=4,
+                        help="Simultaneous LLM requests (default 4)")
+    parser.add_argument('--tts-concurrency', type=int, default=TTS_CONCURRENCY,
+                        help=f"Simultaneous TTS requests across all units (default {TTS_CONCURRENCY})")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="Regenerate topics that already have a unit")
+    args = parser.parse_args(argv)
+
+    topics = read_topics(args.topics_file)
+    skipped = 0
+    if not args.no_resume:
+        done = existing_topics()
+        pending = [topic for topic in topics if topic not in done]
+        skipped = len(topics) - len(pending)
+        topics = pending
+
+    print(f"📚 {len(topics)} topics to generate, {skipped} already done")
+    if not topics:
+        return 0
+
+    summary = asyncio.run(generate_batch(topics, args.llm_concurrency, args.tts_concurrency))
+
+    succeeded = len(summary['succeeded'])
+    minutes = summary['elapsed'] / 60
+    rate = succeeded / minutes if minutes > 0 else 0.0
+    print(f"\n✅ {succeeded}/{len(topics)} units in {summary['elapsed']:.1f}s "
+          f"({rate:.1f} units/minute), {skipped} skipped")
+    for topic, error in summary['failed'].items():
+        print(f"   ✗ {topic}: {error}")
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,19 +2,68 @@
 Content Generator
 Uses OpenAI API to generate learning unit content
 """
-import json
+import asyncio
+import contextlib
+import secrets
+import threading
 import time
-from openai import OpenAI
-from dotenv import load_dotenv
+from typing import Callable, Dict, List, Optional
 import os
 
-from utils.jyutping import get_jyutping
+from core.constants import GENERATION_WARMUP
+from utils.jyutping import annotate_jyutping, warm_up_jyutping
 from services.unit_service import save_unit
 from services.srs_service import add_vocabulary
-from generators.audio_generator import generate_unit_audio
+from generators.audio_generator import create_scheduler, plan_sentence_audio, print_report
+from generators.stream_parser import ConversationStreamParser
+from generators.tts_scheduler import TTSJob, TTSReport, TTSScheduler
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# openai (and .env loading) are imported on first use so that sessions
+# which never generate a unit don't pay for them at startup
+_client = None
+_client_lock = threading.Lock()
+_warmup_started = False
+
+
+def get_client():
+    """
+    Get the shared AsyncOpenAI client, creating it on first use
+
+    OPENAI_BASE_URL in the environment redirects it (e.g. to
+    generators/stub_llm_server.py).
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            from dotenv import load_dotenv
+            from openai import AsyncOpenAI
+
+            load_dotenv()
+            _client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return _client
+
+
+def _warm_up():
+    try:
+        get_client()
+    except Exception as e:
+        print(f"Error warming up OpenAI client: {e}")
+    warm_up_jyutping()
+
+
+def start_warmup():
+    """
+    Load the generation stack (openai, pycantonese data) on a background thread
+
+    Safe to call on every rerun; only the first call starts the thread.
+    Does nothing when GENERATION_WARMUP is off.
+    """
+    global _warmup_started
+    with _client_lock:
+        if _warmup_started or not GENERATION_WARMUP:
+            return
+        _warmup_started = True
+    threading.Thread(target=_warm_up, name="generation-warmup", daemon=True).start()
 
 SYSTEM_PROMPT = """You are a Cantonese language course architect creating natural, conversational learning content.
 
@@ -59,51 +108,152 @@ OUTPUT FORMAT - Valid JSON only:
 }"""
 
 
-async def build_unit(topic: str) -> dict:
+# (stage, done, total) with stage one of STAGES; total is 0 while unknown
+ProgressFn = Callable[[str, int, int], None]
+STAGES = ('llm', 'jyutping', 'audio', 'save')
+
+
+def new_unit_id() -> str:
+    """Time-ordered unit id that stays unique when units are generated concurrently"""
+    return f"{int(time.time())}_{secrets.token_hex(3)}"
+
+
+class _BuildProgress:
+    """Per-stage counters for one build, forwarded to a ProgressFn"""
+
+    def __init__(self, on_progress: Optional[ProgressFn]):
+        self.on_progress = on_progress
+        self.sentences = 0
+        self.jyutping_done = 0
+        self.audio_total = 0
+        self.audio_done = 0
+
+    def report(self, stage: str, done: int, total: int):
+        if self.on_progress:
+            self.on_progress(stage, done, total)
+
+    def sentence_received(self):
+        self.sentences += 1
+        self.report('llm', self.sentences, 0)
+
+    def sentence_jyutping_done(self):
+        self.jyutping_done += 1
+        self.report('jyutping', self.jyutping_done, self.sentences)
+
+    def audio_queued(self, count: int):
+        self.audio_total += count
+        self.report('audio', self.audio_done, self.audio_total)
+
+    def audio_file_done(self, job: TTSJob):
+        self.audio_done += 1
+        self.report('audio', self.audio_done, self.audio_total)
+
+
+async def _prepare_sentence(sentence: Dict, scheduler: TTSScheduler,
+                            queued: Dict[str, TTSJob], progress: _BuildProgress) -> TTSReport:
+    """Jyutping and audio for one sentence, run while the rest still streams"""
+    await asyncio.to_thread(annotate_jyutping, [sentence])
+    progress.sentence_jyutping_done()
+    jobs, cached = plan_sentence_audio(sentence, scheduler.provider, queued)
+    progress.audio_queued(len(jobs))
+    report = await scheduler.run(jobs, on_done=progress.audio_file_done)
+    report.cached = cached
+    return report
+
+
+async def build_unit(topic: str, on_progress: Optional[ProgressFn] = None,
+                     scheduler: Optional[TTSScheduler] = None,
+                     llm_limit: Optional[asyncio.Semaphore] = None) -> dict:
     """
     Generate a complete learning unit from a topic
 
+    The completion is streamed: each conversation sentence is handed to
+    Jyutping and TTS as soon as its JSON is complete, so audio synthesis
+    overlaps generation of the following sentences.
+
     Args:
         topic: The topic/situation for the unit
+        on_progress: Called with (stage, done, total) as the build advances
+        scheduler: Shared TTS scheduler (a default one is created if omitted)
+        llm_limit: Semaphore held while the completion streams, to cap
+            concurrent LLM requests across builds
 
     Returns:
         Complete unit dictionary
     """
-    unit_id = str(int(time.time()))
+    unit_id = new_unit_id()
 
     print(f"🎨 Designing unit: {topic}...")
+    start = time.perf_counter()
+
+    scheduler = scheduler or create_scheduler()
+    progress = _BuildProgress(on_progress)
+    progress.report('llm', 0, 0)
+    queued: Dict[str, TTSJob] = {}
+    parser = ConversationStreamParser()
+    streamed: List[Dict] = []
+    tasks: List[asyncio.Task] = []
+
+    try:
+        async with llm_limit or contextlib.nullcontext():
+            # Generate content with AI
+            stream = await get_client().chat.completions.create(
+                model="gpt-4o",
+                response_format={"type": "json_object"},
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": f"Create a unit about: {topic}"}
+                ],
+                temperature=0.7,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                for sentence in parser.feed(chunk.choices[0].delta.content):
+                    streamed.append(sentence)
+                    progress.sentence_received()
+                    tasks.append(asyncio.create_task(
+                        _prepare_sentence(sentence, scheduler, queued, progress)
+                    ))
+
+        unit_data = parser.result()
+        llm_seconds = time.perf_counter() - start
+        print(f"📝 Content ready in {llm_seconds:.1f}s, {len(tasks)} sentences already in progress")
+
+        # Keep the objects the pipeline has been filling in; anything the
+        # incremental parse missed is processed now
+        conversation = unit_data['conversation']
+        for i, sentence in enumerate(conversation):
+            if i < len(streamed):
+                conversation[i] = streamed[i]
+            else:
+                progress.sentence_received()
+                tasks.append(asyncio.create_task(
+                    _prepare_sentence(sentence, scheduler, queued, progress)
+                ))
+
+        report = TTSReport()
+        for sentence_report in await asyncio.gather(*tasks):
+            report.merge(sentence_report)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    report.elapsed = time.perf_counter() - start
+    print_report(report)
+    print(f"⏱️ Audio finished {report.elapsed - llm_seconds:.1f}s after the content")
 
-    # Generate content with AI
-    response = client.chat.completions.create(
-        model="gpt-4o",
-        response_format={"type": "json_object"},
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": f"Create a unit about: {topic}"}
-        ],
-        temperature=0.7
-    )
-
-    unit_data = json.loads(response.choices[0].message.content)
     unit_data['id'] = unit_id
+    unit_data['topic'] = topic
 
     # Trim title if too long
     if len(unit_data.get('title', '')) > 50:
         unit_data['title'] = topic[:50]
 
-    # Add Jyutping to all text
-    print("📝 Adding Jyutping...")
-    for sentence in unit_data['conversation']:
-        sentence['jyutping'] = get_jyutping(sentence['cantonese'])
-
-        for chunk in sentence['chunks']:
-            chunk['jyutping'] = get_jyutping(chunk['cantonese'])
-
-    # Generate audio
-    print("🔊 Generating audio...")
-    await generate_unit_audio(unit_data, unit_id)
-
     # Save unit
+    progress.report('save', 0, 1)
     save_unit(unit_data)
 
     # Add to vocabulary
@@ -111,6 +261,7 @@ async def build_unit(topic: str) -> dict:
     for sentence in unit_data['conversation']:
         all_chunks.extend(sentence['chunks'])
     add_vocabulary(all_chunks)
+    progress.report('save', 1, 1)
 
     print(f"✅ Unit '{unit_data['title']}' created successfully!")
     return unit_data
\ No newline at end of file
@@ -0,0 +1,274 @@
+"""
+Job Queue
+Background unit generation with persisted job state and per-stage progress
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+from core.constants import (
+    JOBS_PATH, JOB_CONCURRENCY, JOB_HISTORY, JOB_HEARTBEAT_SECONDS, JOB_STALE_SECONDS
+)
+from utils.durable import atomic_write_json, file_lock
+from generators.audio_generator import create_scheduler
+from generators.content_generator import build_unit, new_unit_id
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class GenerationQueue:
+    """
+    Runs build_unit jobs on a worker thread with its own event loop
+
+    Streamlit sessions submit topics and return immediately; the worker
+    runs up to `concurrency` builds at once, all sharing one TTS scheduler
+    so total TTS load stays capped. Job records (status, current stage and
+    per-stage done/total counts) live in memory for polling and are merged
+    into `path` on every status or stage change.
+
+    Several processes can share `path`: each one only rewrites the records
+    it owns and stamps a heartbeat on its active jobs every
+    JOB_HEARTBEAT_SECONDS. Active jobs whose heartbeat is older than
+    JOB_STALE_SECONDS (their process stopped) are taken over on start.
+
+    Args:
+        path: JSON file holding job records
+        concurrency: Builds running at the same time
+        history: Finished jobs kept in the file
+    """
+
+    def __init__(self, path: str = JOBS_PATH, concurrency: int = JOB_CONCURRENCY,
+                 history: int = JOB_HISTORY):
+        self.path = path
+        self.concurrency = concurrency
+        self.history = history
+        self._owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Dict] = {}
+        self._mtime = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="unit-jobs", daemon=True)
+        self._thread.start()
+        self._semaphore = asyncio.run_coroutine_threadsafe(self._make_semaphore(), self._loop).result()
+        self._scheduler = create_scheduler()
+
+        for job_id in self._adopt_stale_jobs():
+            self._schedule(job_id)
+        self._watch(asyncio.run_coroutine_threadsafe(self._heartbeat(), self._loop), "heartbeat")
+
+    def submit(self, topic: str) -> str:
+        """
+        Queue a unit for generation
+
+        Args:
+            topic: The topic/situation for the unit
+
+        Returns:
+            Job id
+        """
+        job_id = new_unit_id()
+        with self._lock:
+            self._jobs[job_id] = {
+                'id': job_id,
+                'topic': topic,
+                'status': 'queued',
+                'stage': None,
+                'progress': {},
+                'unit_id': None,
+                'error': None,
+                'owner': self._owner,
+                'heartbeat': time.time(),
+                'created_at': time.time(),
+                'started_at': None,
+                'finished_at': None
+            }
+            self._persist()
+        self._schedule(job_id)
+        return job_id
+
+    def jobs(self) -> List[Dict]:
+        """Copies of all job records, including other processes' jobs, newest first"""
+        with self._lock:
+            self._refresh()
+            return [
+                dict(job, progress=dict(job['progress']))
+                for job in sorted(self._jobs.values(), key=lambda j: j['created_at'], reverse=True)
+            ]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Copy of one job record, or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job, progress=dict(job['progress'])) if job else None
+
+    def clear_finished(self):
+        """Forget jobs that are done or failed"""
+        with self._lock:
+            self._persist(drop_finished=True)
+
+    async def _make_semaphore(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(self.concurrency)
+
+    def _schedule(self, job_id: str):
+        self._watch(asyncio.run_coroutine_threadsafe(self._run(job_id), self._loop), f"job {job_id}")
+
+    @staticmethod
+    def _watch(future: Future, name: str):
+        """Log errors that escape a coroutine running on the worker loop"""
+        def done(f: Future):
+            if not f.cancelled() and f.exception():
+                print(f"Error in generation {name}: {f.exception()!r}")
+        future.add_done_callback(done)
+
+    async def _run(self, job_id: str):
+        async with self._semaphore:
+            job = self.get(job_id)
+            if not job:
+                return
+            topic = job['topic']
+            self._update(job_id, status='running', started_at=time.time())
+
+            def on_progress(stage: str, done: int, total: int):
+                self._set_progress(job_id, stage, done, total)
+
+            try:
+                unit = await build_unit(topic, on_progress=on_progress, scheduler=self._scheduler)
+            except Exception as e:
+                print(f"Error generating unit '{topic}': {e}")
+                self._update(job_id, status='failed', error=f"{type(e).__name__}: {e}",
+                             finished_at=time.time())
+                return
+            self._update(job_id, status='done', unit_id=unit['id'], finished_at=time.time())
+
+    async def _heartbeat(self):
+        """Keep this process's active jobs from looking abandoned"""
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+            with self._lock:
+                if any(self._is_own(job) and job['status'] in ACTIVE_STATUSES
+                       for job in self._jobs.values()):
+                    self._persist()
+
+    def _set_progress(self, job_id: str, stage: str, done: int, total: int):
+        with self._lock:
+            job = self._jobs[job_id]
+            stage_changed = job['stage'] != stage or stage not in job['progress']
+            job['stage'] = stage
+            job['progress'][stage] = [done, total]
+            # Counts within a stage are served from memory; file writes
+            # follow stage transitions only
+            if stage_changed:
+                self._persist()
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+            self._persist()
+
+    def _is_own(self, job: Dict) -> bool:
+        return job.get('owner') == self._owner
+
+    def _adopt_stale_jobs(self) -> List[str]:
+        """Take over active jobs whose process stopped; returns their ids"""
+        adopted = []
+        with self._lock:
+            try:
+                with file_lock(self.path):
+                    self._jobs = self._read()
+                    now = time.time()
+                    for job in self._jobs.values():
+                        if (job['status'] in ACTIVE_STATUSES
+                                and now - (job.get('heartbeat') or 0) > JOB_STALE_SECONDS):
+                            job.update(status='queued', stage=None, progress={}, started_at=None,
+                                       owner=self._owner, heartbeat=now)
+                            adopted.append(job['id'])
+                    if adopted:
+                        atomic_write_json(self.path, list(self._jobs.values()), indent=2)
+                    self._mtime = os.stat(self.path).st_mtime_ns if self._jobs else None
+            except OSError as e:
+                print(f"Error loading jobs: {e}")
+        return adopted
+
+    def _refresh(self):
+        """Pick up other processes' changes if the file changed (caller holds self._lock)"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        with file_lock(self.path):
+            stored = self._read()
+        own = {job_id: job for job_id, job in self._jobs.items() if self._is_own(job)}
+        self._jobs = {job_id: job for job_id, job in stored.items() if not self._is_own(job)}
+        self._jobs.update(own)
+        self._mtime = mtime
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return {job['id']: job for job in json.load(f)}
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"Error loading jobs: {e}")
+            return {}
+
+    def _persist(self, drop_finished: bool = False):
+        """
+        Merge this process's job records into the file (caller holds self._lock)
+
+        Records owned by other processes are re-read and kept as they are, so
+        concurrent writers never erase each other's jobs.
+        """
+        now = time.time()
+        own = {}
+        for job_id, job in self._jobs.items():
+            if self._is_own(job):
+                if job['status'] in ACTIVE_STATUSES:
+                    job['heartbeat'] = now
+                own[job_id] = job
+
+        try:
+            with file_lock(self.path):
+                merged = self._read()
+                for job_id, job in own.items():
+                    # Skip jobs another process has taken over
+                    if merged.get(job_id, job).get('owner') == self._owner:
+                        merged[job_id] = job
+                if drop_finished:
+                    merged = {
+                        job_id: job for job_id, job in merged.items()
+                        if job['status'] in ACTIVE_STATUSES
+                    }
+
+                jobs = sorted(merged.values(), key=lambda j: j['created_at'])
+                finished = [job for job in jobs if job['status'] not in ACTIVE_STATUSES]
+                for job in finished[:max(0, len(finished) - self.history)]:
+                    del merged[job['id']]
+
+                atomic_write_json(self.path, list(merged.values()), indent=2)
+                self._mtime = os.stat(self.path).st_mtime_ns
+        except OSError as e:
+            print(f"Error saving jobs: {e}")
+            return
+        # Own records stay the live objects the worker updates
+        merged.update({job_id: job for job_id, job in own.items() if job_id in merged})
+        self._jobs = merged
+
+
+_queue: Optional[GenerationQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_generation_queue() -> GenerationQueue:
+    """Get the process-wide generation queue, starting its worker on first use"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = GenerationQueue()
+        return _queue
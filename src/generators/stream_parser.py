@@ -0,0 +1,107 @@
+"""
+Stream Parser
+Pull complete conversation sentences out of a unit JSON document as it streams
+"""
+import json
+from typing import Dict, List
+
+
+class ConversationStreamParser:
+    """
+    Incremental scanner for the unit JSON produced by the LLM
+
+    Text is fed in arbitrary pieces. Once the "conversation" array has
+    started, each element is returned by feed() as soon as its closing brace
+    arrives, so later stages can start on it while the rest is still being
+    generated. Only string/escape state and nesting depth are tracked, so each
+    character is looked at once.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._item_start = -1
+
+    def feed(self, delta: str) -> List[Dict]:
+        """
+        Add streamed text
+
+        Args:
+            delta: Next piece of the completion
+
+        Returns:
+            Sentences completed by this piece, in order
+        """
+        self.text += delta
+        if not self._in_array and not self._find_array():
+            return []
+
+        sentences = []
+        text = self.text
+        while self._pos < len(text) and not self._done:
+            char = text[self._pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                if self._depth == 0 and char == '{':
+                    self._item_start = self._pos
+                self._depth += 1
+            elif char in '}]':
+                if self._depth == 0:
+                    self._done = True  # End of the conversation array
+                else:
+                    self._depth -= 1
+                    if self._depth == 0 and char == '}':
+                        sentences.append(self._parse_item(text[self._item_start:self._pos + 1]))
+            self._pos += 1
+        return [s for s in sentences if s is not None]
+
+    def result(self) -> Dict:
+        """
+        Parse the whole document once the stream has ended
+
+        Raises:
+            json.JSONDecodeError: If the completion is not valid JSON
+        """
+        return json.loads(self.text)
+
+    def _find_array(self) -> bool:
+        marker = '"conversation"'
+        key = self.text.find(marker)
+        while key != -1:
+            # Must be the key ("conversation": [), not a string value
+            rest = self.text[key + len(marker):].lstrip()
+            if not rest.startswith(':'):
+                if rest:
+                    key = self.text.find(marker, key + 1)
+                    continue
+                return False
+            rest = rest[1:].lstrip()
+            if not rest:
+                return False
+            if rest[0] != '[':
+                key = self.text.find(marker, key + 1)
+                continue
+            self._in_array = True
+            self._pos = len(self.text) - len(rest) + 1
+            return True
+        return False
+
+    def _parse_item(self, raw: str):
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            print(f"Error parsing streamed sentence: {e}")
+            return None
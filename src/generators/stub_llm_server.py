@@ -0,0 +1,159 @@
+"""
+Stub LLM Server
+OpenAI-compatible chat completions endpoint that streams a canned unit
+
+Point the app at it for offline runs and pipeline benchmarks:
+
+    python -m generators.stub_llm_server --port 8766 --delay 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8766/v1 CANTO_TTS_PROVIDER=tone streamlit run app.py
+"""
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+SAMPLE_CONVERSATION = [
+    ("A", "你好呀。", "Hello!", [("你", "you"), ("好", "good/well"), ("呀", "(friendly particle)")]),
+    ("B", "你好，你食咗飯未呀？", "Hi, have you eaten yet?",
+     [("你", "you"), ("好", "good/well"), ("你", "you"), ("食", "eat"), ("咗", "(completed action)"),
+      ("飯", "rice/meal"), ("未", "not yet"), ("呀", "(question particle)")]),
+    ("A", "食咗喇，多謝。", "I have, thanks.",
+     [("食", "eat"), ("咗", "(completed action)"), ("喇", "(change of state)"), ("多謝", "thank you")]),
+    ("B", "你今日去邊度呀？", "Where are you going today?",
+     [("你", "you"), ("今日", "today"), ("去", "go"), ("邊度", "where"), ("呀", "(question particle)")]),
+    ("A", "我去街市買餸。", "I'm going to the market to buy groceries.",
+     [("我", "I"), ("去", "go"), ("街市", "wet market"), ("買", "buy"), ("餸", "groceries")]),
+    ("B", "好呀，一齊去啦。", "Great, let's go together.",
+     [("好", "good"), ("呀", "(agreement particle)"), ("一齊", "together"), ("去", "go"),
+      ("啦", "(suggestion)")]),
+]
+
+
+def sample_unit(topic: str) -> Dict:
+    """Canned unit in the format SYSTEM_PROMPT asks for"""
+    return {
+        "title": topic[:50] or "Stub Unit",
+        "topic_description": f"Stub conversation about {topic}",
+        "conversation": [
+            {
+                "id": i,
+                "speaker": speaker,
+                "cantonese": cantonese,
+                "english_natural": english,
+                "chunks": [{"cantonese": c, "english": e} for c, e in chunks]
+            }
+            for i, (speaker, cantonese, english, chunks) in enumerate(SAMPLE_CONVERSATION)
+        ]
+    }
+
+
+def _pieces(text: str, size: int) -> List[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    """Handles POST /v1/chat/completions, streaming or not"""
+
+    delay = 0.0        # Seconds between streamed pieces
+    piece_size = 16    # Characters per streamed piece
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        prompt = request.get('messages', [{}])[-1].get('content', '')
+        topic = prompt.split(':', 1)[-1].strip()
+        content = json.dumps(sample_unit(topic), ensure_ascii=False)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        if request.get('stream'):
+            self._stream(completion_id, request.get('model', ''), content)
+        else:
+            self._send_json({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get('model', ''),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop"
+                }]
+            })
+
+    def _stream(self, completion_id: str, model: str, content: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        def event(delta: Dict, finish_reason=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+
+        event({"role": "assistant", "content": ""})
+        for piece in _pieces(content, self.piece_size):
+            if self.delay:
+                time.sleep(self.delay)
+            event({"content": piece})
+        event({}, finish_reason="stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_json(self, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, delay: float = 0.0) -> str:
+    """
+    Start the stub server in a daemon thread
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+        delay: Seconds between streamed pieces, to mimic generation speed
+
+    Returns:
+        Base URL to use as OPENAI_BASE_URL
+    """
+    handler = type("ConfiguredStubLLMHandler", (StubLLMHandler,), {"delay": delay})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="stub-llm", daemon=True).start()
+    return f"http://{host}:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve a canned unit as an OpenAI-compatible stream")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--delay", type=float, default=0.02, help="seconds between streamed pieces")
+    args = parser.parse_args()
+
+    url = start_stub_server(args.host, args.port, args.delay)
+    print(f"Stub LLM listening: OPENAI_BASE_URL={url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,165 @@
+"""
+TTS Scheduler
+Bounded-concurrency speech synthesis with retries, timeouts and a report
+"""
+import asyncio
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+from core.constants import TTS_CONCURRENCY, TTS_MAX_RETRIES, TTS_TIMEOUT, TTS_BACKOFF_BASE
+
+# (text, filepath, voice) -> writes filepath, raises on failure
+SynthesizeFn = Callable[[str, str, str], Awaitable[None]]
+
+
+@dataclass
+class TTSJob:
+    """One file to synthesize"""
+    text: str
+    filepath: str
+    voice: str
+
+
+@dataclass
+class TTSReport:
+    """Outcome of a scheduler run"""
+    total: int = 0
+    succeeded: int = 0
+    retries: int = 0
+    failed: List[Dict] = field(default_factory=list)
+    elapsed: float = 0.0
+    cached: int = 0  # Utterances served from the shared audio cache
+
+    @property
+    def files_per_second(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cached + self.total
+        return self.cached / lookups if lookups else 0.0
+
+    def merge(self, other: 'TTSReport'):
+        """Add another run's counts and failures (elapsed is left to the caller)"""
+        self.total += other.total
+        self.succeeded += other.succeeded
+        self.retries += other.retries
+        self.cached += other.cached
+        self.failed.extend(other.failed)
+
+    def summary(self) -> str:
+        """One-line human readable summary"""
+        text = (f"{self.succeeded}/{self.total} audio files in {self.elapsed:.1f}s "
+                f"({self.files_per_second:.1f} files/s, {self.retries} retries)")
+        if self.cached:
+            text += f", {self.cached} cached ({self.cache_hit_rate:.0%} hit rate)"
+        if self.failed:
+            text += f", {len(self.failed)} failed"
+        return text
+
+
+class TTSScheduler:
+    """
+    Runs TTS jobs with at most `concurrency` requests in flight
+
+    Each job gets a per-attempt timeout and up to `max_retries` retries with
+    exponential backoff plus jitter. Audio is written to a temp file and
+    renamed into place, so a target path never holds a partial file.
+    Failures are collected in the report instead of being raised. A
+    scheduler can be shared by several concurrent runs (e.g. batch
+    generation) to cap total TTS load.
+
+    Args:
+        synthesize: Coroutine function that writes one audio file
+        concurrency: Maximum simultaneous synthesize calls
+        max_retries: Retries after the first failed attempt
+        timeout: Seconds allowed per attempt
+        backoff_base: First retry delay in seconds (doubles each retry)
+        provider: TTSProvider behind `synthesize`, if any (callers use its
+            params and file extension to address the output)
+    """
+
+    def __init__(self, synthesize: SynthesizeFn, concurrency: int = TTS_CONCURRENCY,
+                 max_retries: int = TTS_MAX_RETRIES, timeout: float = TTS_TIMEOUT,
+                 backoff_base: float = TTS_BACKOFF_BASE, provider=None):
+        self.synthesize = synthesize
+        self.provider = provider
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop = None
+
+    async def run(self, jobs: List[TTSJob],
+                  on_done: Optional[Callable[[TTSJob], None]] = None) -> TTSReport:
+        """
+        Synthesize all jobs
+
+        Args:
+            jobs: Files to generate
+            on_done: Called after each job finishes, whether or not it succeeded
+
+        Returns:
+            TTSReport with counts, failures and elapsed time
+        """
+        report = TTSReport(total=len(jobs))
+        start = time.perf_counter()
+        await asyncio.gather(*(self._run_job(job, report, on_done) for job in jobs))
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop; the scheduler may outlive it
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run_job(self, job: TTSJob, report: TTSReport, on_done=None):
+        try:
+            await self._attempt_job(job, report)
+        finally:
+            if on_done:
+                on_done(job)
+
+    async def _attempt_job(self, job: TTSJob, report: TTSReport):
+        error = None
+        tmp_path = f"{job.filepath}.{uuid.uuid4().hex}.part"
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                report.retries += 1
+                delay = self.backoff_base * (2 ** (attempt - 1))
+                await asyncio.sleep(delay + random.uniform(0, self.backoff_base))
+
+            try:
+                async with self._get_semaphore():
+                    await asyncio.wait_for(
+                        self.synthesize(job.text, tmp_path, job.voice), self.timeout
+                    )
+                if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
+                    raise RuntimeError("TTS produced no audio")
+                os.replace(tmp_path, job.filepath)
+                report.succeeded += 1
+                return
+            except Exception as e:
+                error = e
+                _remove_partial(tmp_path)
+
+        report.failed.append({
+            'filepath': job.filepath,
+            'text': job.text,
+            'voice': job.voice,
+            'error': f"{type(error).__name__}: {error}"
+        })
+
+
+def _remove_partial(filepath: str):
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
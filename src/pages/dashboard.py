@@ -5,7 +5,7 @@ Shows unit details and lesson selection
 import streamlit as st
 from core.state import navigate_to, get_state
 from core.constants import LESSON_CHUNK_SIZE
-from services.progress_service import get_unit_completion_stats, get_lesson_progress, mark_lesson_started
+from services.progress_service import get_unit_completion_stats, get_unit_lessons_status, mark_lesson_started
 
 def render():
     """Render unit dashboard"""
@@ -69,6 +69,11 @@ def render():
     conversation = unit.get('conversation', [])
     total_lessons = (len(conversation) + LESSON_CHUNK_SIZE - 1) // LESSON_CHUNK_SIZE
 
+    # Status of every lesson in one lookup
+    lesson_status = get_unit_lessons_status(
+        unit_id, [f"lesson_{n}" for n in range(1, total_lessons + 1)]
+    )
+
     # Display lessons in a grid
     cols = st.columns(3)
     for i in range(0, len(conversation), LESSON_CHUNK_SIZE):
@@ -85,16 +90,16 @@ def render():
                 end=batch_end,
                 lesson_key=lesson_key,
                 unit=unit,
-                conversation=conversation
+                conversation=conversation,
+                progress=lesson_status[lesson_key]
             )
 
-def _render_lesson_card(lesson_num, start, end, lesson_key, unit, conversation):
+def _render_lesson_card(lesson_num, start, end, lesson_key, unit, conversation, progress):
     """Render a lesson card"""
     preview = conversation[start].get('cantonese', '')[:20] + "..."
 
     # Check if completed
     unit_id = unit.get('id')
-    progress = get_lesson_progress(unit_id, lesson_key)
     is_completed = progress.get('completed', False)
 
     status_badge = "✅" if is_completed else "◯"
@@ -144,5 +149,6 @@ def _start_lesson(unit, start, end, lesson_key, lesson_type='full'):
         current_unit=unit,
         lesson_range=(start, end),
         lesson_key=lesson_key,
-        lesson_type=lesson_type
+        lesson_type=lesson_type,
+        lesson_completed=False
     )
\ No newline at end of file
@@ -4,9 +4,9 @@ Renders the interactive lesson player
 """
 import streamlit as st
 from core.state import navigate_to, get_state, set_state
-from services.lesson_service import generate_lesson_plan
 from services.progress_service import save_lesson_progress
-from components.player import render_player
+from components.player import render_player_payload
+from components.lesson_cache import get_lesson_payload
 
 def render():
     """Render lesson player"""
@@ -24,15 +24,12 @@ def render():
 
     unit_id = unit.get('id')
 
-    # Check query params for completion
-    query_params = st.query_params
-    if query_params.get('completed') == 'true':
-        save_lesson_progress(unit_id, lesson_key, completed=True)
+    # Set by the player's completion event
+    if get_state('lesson_completed'):
         st.success("✅ Lesson completed! Great job! 🎉")
         st.balloons()
         if st.button("📚 Back to Unit", type="primary"):
-            st.query_params.clear()
-            navigate_to('dashboard', current_unit=unit)
+            navigate_to('dashboard', current_unit=unit, lesson_completed=False)
             st.rerun()
         return
 
@@ -45,9 +42,19 @@ def render():
             navigate_to('dashboard', current_unit=unit)
             st.rerun()
 
-    # Generate and render lesson
+    # Generate (or reuse) and render lesson
     start, end = lesson_range
-    subset = unit['conversation'][start:end]
-    lesson_plan = generate_lesson_plan(subset, lesson_type)
+    payload = get_lesson_payload(unit, start, end, lesson_type)
+
+    render_player_payload(
+        payload,
+        key=f"lesson_{unit_id}_{lesson_key}",
+        on_event=lambda event: _handle_event(event, unit_id, lesson_key)
+    )
 
-    render_player(lesson_plan, key=lesson_key, srs_mode=False)
\ No newline at end of file
+
+def _handle_event(event: dict, unit_id: str, lesson_key: str):
+    """Handle an event from the player (runs before the rerun)"""
+    if event.get('type') == 'complete':
+        save_lesson_progress(unit_id, lesson_key, completed=True)
+        set_state('lesson_completed', True)
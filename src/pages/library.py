@@ -2,32 +2,45 @@
 Library Page
 Displays and manages learning units
 """
-import asyncio
 import streamlit as st
-from core.state import navigate_to
-from services.unit_service import get_all_units, load_unit
+from core.state import navigate_to, get_state, set_state
+from core.constants import LIBRARY_PAGE_SIZE, JOB_POLL_SECONDS
+from services.unit_service import search_unit_summaries, load_unit
+from services.progress_service import get_all_progress
 from services.srs_service import get_vocab_stats
-from generators.content_generator import build_unit
+from generators.content_generator import start_warmup
+from generators.job_queue import ACTIVE_STATUSES, get_generation_queue
+
+STAGE_LABELS = {
+    'llm': "Writing conversation",
+    'jyutping': "Adding Jyutping",
+    'audio': "Generating audio",
+    'save': "Saving",
+}
 
 def render_sidebar_create():
     """Render unit creation in sidebar"""
+    start_warmup()
     st.subheader("✨ Create New Unit")
 
-    topic = st.text_input(
-        "Topic",
-        placeholder="e.g., Ordering food at a restaurant",
-        help="What situation or topic would you like to learn?"
+    topics = st.text_area(
+        "Topics",
+        placeholder="e.g., Ordering food at a restaurant\n(one topic per line)",
+        help="What situations or topics would you like to learn? Each line becomes a unit."
     )
 
     if st.button("🚀 Generate Unit", type="primary", use_container_width=True):
-        if topic.strip():
-            with st.spinner("Creating your lesson... 🎨"):
-                asyncio.run(build_unit(topic.strip()))
-            st.success("✅ Unit created!")
-            st.rerun()
+        topic_list = [t.strip() for t in topics.splitlines() if t.strip()]
+        if topic_list:
+            queue = get_generation_queue()
+            for topic in topic_list:
+                queue.submit(topic)
+            st.success(f"✅ Queued {len(topic_list)} unit(s) - keep studying meanwhile!")
         else:
             st.error("Please enter a topic")
 
+    _render_jobs()
+
     st.markdown("---")
 
     # Stats
@@ -36,12 +49,88 @@ def render_sidebar_create():
     if stats['due'] > 0:
         st.metric("🔔 Due for Review", stats['due'])
 
+def _render_jobs():
+    """Show the generation queue, polling only while jobs are queued or running"""
+    jobs = get_generation_queue().jobs()
+    if any(job['status'] in ACTIVE_STATUSES for job in jobs):
+        _poll_jobs()
+    else:
+        _show_jobs(jobs)
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _poll_jobs():
+    """Refresh per-stage progress every JOB_POLL_SECONDS"""
+    jobs = get_generation_queue().jobs()
+
+    # Refresh the whole page when a unit finishes so it appears in the grid,
+    # and when the queue drains so this fragment stops polling
+    done_ids = {job['id'] for job in jobs if job['status'] == 'done'}
+    seen = get_state('library_seen_jobs')
+    set_state('library_seen_jobs', done_ids)
+    active = any(job['status'] in ACTIVE_STATUSES for job in jobs)
+    if (seen is not None and done_ids - seen) or not active:
+        st.rerun()
+
+    _show_jobs(jobs)
+
+def _show_jobs(jobs: list):
+    """Show per-stage progress of recent jobs"""
+    if not jobs:
+        return
+
+    st.caption("Generation queue")
+    for job in jobs[:5]:
+        topic = job['topic'] if len(job['topic']) <= 40 else job['topic'][:37] + "..."
+        if job['status'] == 'queued':
+            st.markdown(f"⏳ {topic}")
+        elif job['status'] == 'running':
+            stage = job['stage'] or 'llm'
+            done, total = job['progress'].get(stage, [0, 0])
+            label = STAGE_LABELS.get(stage, stage)
+            if stage == 'llm':
+                detail = f"{done} sentences"
+            else:
+                detail = f"{done}/{total}"
+            st.markdown(f"🎨 {topic}")
+            st.progress(done / total if total else 0.0, text=f"{label} · {detail}")
+        elif job['status'] == 'done':
+            st.markdown(f"✅ {topic}")
+        else:
+            st.markdown(f"❌ {topic}", help=job.get('error') or "Generation failed")
+
+    if any(job['status'] not in ACTIVE_STATUSES for job in jobs):
+        if st.button("Clear finished", key="clear_jobs"):
+            get_generation_queue().clear_finished()
+            st.rerun()
+
 def render():
     """Render main library view"""
     st.title("📚 Your Learning Library")
     st.markdown("Select a unit to start learning or create a new one in the sidebar.")
 
-    units = get_all_units()
+    query = st.text_input(
+        "🔍 Search",
+        key="library_search",
+        placeholder="Search by title or topic",
+        label_visibility="collapsed"
+    )
+    if query != get_state('library_query'):
+        set_state('library_query', query)
+        set_state('library_page', 0)
+
+    # Only the visible page is read from the index
+    page = get_state('library_page', 0)
+    units, total = search_unit_summaries(query, page, LIBRARY_PAGE_SIZE)
+    page_count = max(1, (total + LIBRARY_PAGE_SIZE - 1) // LIBRARY_PAGE_SIZE)
+    if page >= page_count:
+        # Page no longer exists (e.g. after deleting its last unit)
+        page = page_count - 1
+        set_state('library_page', page)
+        units, total = search_unit_summaries(query, page, LIBRARY_PAGE_SIZE)
+
+    if not units and query:
+        st.info(f"No units match \"{query}\".")
+        return
 
     if not units:
         st.info("""
@@ -59,6 +148,9 @@ def render():
         """)
         return
 
+    # One progress read for the whole grid
+    all_progress = get_all_progress()
+
     # Display units in a grid
     cols_per_row = 2
     for i in range(0, len(units), cols_per_row):
@@ -69,25 +161,40 @@ def render():
             if idx >= len(units):
                 break
 
-            unit_file = units[idx]
-            unit = load_unit(unit_file)
+            with col:
+                _render_unit_card(units[idx], all_progress)
 
-            if not unit:
-                continue
+    if page_count > 1:
+        _render_pagination(page, page_count, total)
 
-            with col:
-                _render_unit_card(unit, unit_file)
+def _render_pagination(page: int, page_count: int, total: int):
+    """Render previous/next controls for the unit grid"""
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("← Previous", disabled=page == 0, use_container_width=True):
+            set_state('library_page', page - 1)
+            st.rerun()
+    with col2:
+        st.markdown(
+            f"<div style='text-align: center; color: #6b7280; padding-top: 8px;'>"
+            f"Page {page + 1} of {page_count} · {total} units</div>",
+            unsafe_allow_html=True
+        )
+    with col3:
+        if st.button("Next →", disabled=page >= page_count - 1, use_container_width=True):
+            set_state('library_page', page + 1)
+            st.rerun()
 
-def _render_unit_card(unit: dict, filename: str):
-    """Render a single unit card"""
+def _render_unit_card(summary: dict, all_progress: dict):
+    """Render a single unit card from its index entry"""
     from services.progress_service import get_unit_completion_stats
     from core.constants import LESSON_CHUNK_SIZE
 
     # Calculate progress
-    conversation = unit.get('conversation', [])
-    total_lessons = (len(conversation) + LESSON_CHUNK_SIZE - 1) // LESSON_CHUNK_SIZE
-    unit_id = unit.get('id')
-    stats = get_unit_completion_stats(unit_id, total_lessons)
+    filename = summary['filename']
+    sentence_count = summary.get('sentence_count', 0)
+    total_lessons = (sentence_count + LESSON_CHUNK_SIZE - 1) // LESSON_CHUNK_SIZE
+    stats = get_unit_completion_stats(summary.get('id'), total_lessons, all_progress)
 
     progress_text = ""
     if stats['completed'] > 0:
@@ -103,13 +210,13 @@ def _render_unit_card(unit: dict, filename: str):
             height: 100%;
         ">
             <h3 style="margin: 0 0 10px 0; color: #1f2937;">
-                {unit.get('title', 'Untitled')}
+                {summary.get('title') or 'Untitled'}
             </h3>
             <p style="color: #6b7280; margin-bottom: 15px; font-size: 0.9em;">
-                {unit.get('topic_description', 'No description')}
+                {summary.get('topic_description') or 'No description'}
             </p>
             <div style="color: #9ca3af; font-size: 0.85em;">
-                📝 {len(unit.get('conversation', []))} sentences
+                📝 {sentence_count} sentences
             </div>
             {progress_text}
         </div>
@@ -118,8 +225,12 @@ def _render_unit_card(unit: dict, filename: str):
         col1, col2 = st.columns([1, 1])
         with col1:
             if st.button("📖 Open", key=f"open_{filename}", use_container_width=True):
-                navigate_to('dashboard', current_unit=unit)
-                st.rerun()
+                unit = load_unit(filename)
+                if unit:
+                    navigate_to('dashboard', current_unit=unit)
+                    st.rerun()
+                else:
+                    st.error("Could not load this unit")
         with col2:
             if st.button("🗑️", key=f"del_{filename}", help="Delete unit"):
                 st.session_state[f'confirm_delete_{filename}'] = True
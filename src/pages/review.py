@@ -2,11 +2,16 @@
 Review Page
 Spaced repetition review system
 """
+import json
 import streamlit as st
+from typing import Dict, List, Tuple
+from core.constants import REVIEW_PRELOAD_CARDS
 from core.state import navigate_to, get_state, set_state
 from services.srs_service import get_due_cards, update_card, get_vocab_stats
 from services.lesson_service import create_srs_slide
-from components.player import render_player
+from components.player import build_player_payload, render_review_player
+
+QUALITIES = (0, 3, 5)  # Again, Good, Easy
 
 
 def render():
@@ -17,6 +22,8 @@ def render():
     # Initialize queue if empty
     if not get_state('srs_queue'):
         set_state('srs_queue', get_due_cards())
+        set_state('srs_graded', set())
+        set_state('srs_batch', None)
 
     queue = get_state('srs_queue', [])
     stats = get_vocab_stats()
@@ -47,33 +54,9 @@ def render():
             st.rerun()
         return
 
-    # Show current card
-    card = queue[0]
-    slide = create_srs_slide(card)
-
-    # Render the quiz
-    render_player([slide], key=f"srs_{card['cantonese']}", srs_mode=True)
-
-    # Quality buttons
-    st.markdown("---")
-    st.markdown("### How well did you know this word?")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        if st.button("❌ Again", use_container_width=True, help="I didn't remember"):
-            _handle_response(card, 0)
-            st.rerun()
-
-    with col2:
-        if st.button("✅ Good", use_container_width=True, help="I remembered with some effort"):
-            _handle_response(card, 3)
-            st.rerun()
-
-    with col3:
-        if st.button("🎯 Easy", use_container_width=True, help="I remembered instantly"):
-            _handle_response(card, 5)
-            st.rerun()
+    # Render the next few cards; grading happens in the player
+    payload, cards = _review_batch(queue)
+    render_review_player(payload, cards, key="srs_review", on_event=_handle_event)
 
     # Progress indicator
     progress = (stats['total'] - len(queue)) / max(stats['total'], 1)
@@ -81,12 +64,55 @@ def render():
     st.caption(f"Progress: {stats['total'] - len(queue)}/{stats['total']} words reviewed today")
 
 
-def _handle_response(card: dict, quality: int):
+def _review_batch(queue: List[Dict]) -> Tuple[str, List[str]]:
+    """
+    Payload and card ids for the review player
+
+    The batch sent last time is reused until half of it has been graded, so
+    the player always has cards preloaded while the next batch is on its way.
+    Graded cards are dropped from it, so a remounted player never shows them.
+    """
+    batch = get_state('srs_batch')
+    queued = {card['cantonese'] for card in queue}
+    if batch:
+        pending = [i for i, card in enumerate(batch['cards']) if card in queued]
+        if len(pending) > REVIEW_PRELOAD_CARDS // 2:
+            if len(pending) < len(batch['cards']):
+                slides = json.loads(batch['payload'])
+                batch = {
+                    'cards': [batch['cards'][i] for i in pending],
+                    'payload': json.dumps([slides[i] for i in pending])
+                }
+                set_state('srs_batch', batch)
+            return batch['payload'], batch['cards']
+
+    cards = queue[:REVIEW_PRELOAD_CARDS]
+    batch = {
+        'cards': [card['cantonese'] for card in cards],
+        'payload': build_player_payload([create_srs_slide(card) for card in cards])
+    }
+    set_state('srs_batch', batch)
+    return batch['payload'], batch['cards']
+
+
+def _handle_event(event: Dict):
+    """Apply grades reported by the review player (runs before the rerun)"""
+    if event.get('type') != 'grade':
+        return
+
+    graded = get_state('srs_graded') or set()
+    for grade in event.get('grades', []):
+        if grade.get('id') in graded or grade.get('quality') not in QUALITIES:
+            continue
+        graded.add(grade['id'])
+        _handle_response(grade['card'], grade['quality'])
+    set_state('srs_graded', graded)
+
+
+def _handle_response(cantonese: str, quality: int):
     """Handle user response to review card"""
-    update_card(card['cantonese'], quality)
+    update_card(cantonese, quality)
 
     # Remove from queue
     queue = get_state('srs_queue', [])
-    if queue:
-        queue.pop(0)
-        set_state('srs_queue', queue)
\ No newline at end of file
+    set_state('srs_queue', [card for card in queue if card['cantonese'] != cantonese])
\ No newline at end of file
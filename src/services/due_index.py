@@ -0,0 +1,77 @@
+"""
+Due Index
+Sorted index of cards by next_review for fast due-card lookups
+"""
+import math
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class DueIndex:
+    """
+    Cards ordered by (next_review, cantonese)
+
+    Counting due cards and taking the next N due are binary searches over a
+    sorted array; rescheduling a card moves a single entry.
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[float, str]] = []
+        self._times: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def rebuild(self, items: Iterable[Tuple[str, float]]):
+        """
+        Replace the index contents
+
+        Args:
+            items: (cantonese, next_review) pairs
+        """
+        self._times = dict(items)
+        self._entries = sorted((t, c) for c, t in self._times.items())
+
+    def set(self, cantonese: str, next_review: float):
+        """Add a card or move it to its new review time"""
+        old = self._times.get(cantonese)
+        if old == next_review:
+            return
+        if old is not None:
+            self._remove_entry(old, cantonese)
+        self._times[cantonese] = next_review
+        insort(self._entries, (next_review, cantonese))
+
+    def remove(self, cantonese: str):
+        """Drop a card from the index"""
+        old = self._times.pop(cantonese, None)
+        if old is not None:
+            self._remove_entry(old, cantonese)
+
+    def count_due(self, now: float) -> int:
+        """Number of cards with next_review <= now"""
+        return self._due_end(now)
+
+    def due(self, now: float, limit: Optional[int] = None) -> List[str]:
+        """
+        Cards due at `now`, most overdue first
+
+        Args:
+            now: Timestamp to compare against
+            limit: Maximum number of cards to return (None for all)
+
+        Returns:
+            List of cantonese keys
+        """
+        end = self._due_end(now)
+        if limit is not None:
+            end = min(end, limit)
+        return [c for _, c in self._entries[:end]]
+
+    def _due_end(self, now: float) -> int:
+        return bisect_left(self._entries, (math.nextafter(now, math.inf),))
+
+    def _remove_entry(self, next_review: float, cantonese: str):
+        pos = bisect_left(self._entries, (next_review, cantonese))
+        if pos < len(self._entries) and self._entries[pos] == (next_review, cantonese):
+            del self._entries[pos]
@@ -0,0 +1,261 @@
+"""
+Payload Service
+Player slide payloads, precompiled per lesson into gzip artifacts at save time
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+from core.constants import CHUNK_COLORS, LESSON_CHUNK_SIZE, PAYLOAD_DIR
+from services.lesson_service import generate_lesson_plan
+from utils.audio import get_audio_src
+from utils.profiling import count_bytes, profiled
+
+# Audio sources are stored as references and resolved when a lesson is
+# opened, because the playable form (data URI or URL with mtime version)
+# depends on delivery mode and on the audio file at view time
+AUDIO_REF_PREFIX = "audio-ref:"
+_AUDIO_REF_PATTERN = re.compile(r'"audio-ref:([^"\\]*)"')
+
+AudioResolver = Callable[[str], Optional[str]]
+
+
+def _audio_ref(rel_path: str) -> str:
+    return AUDIO_REF_PREFIX + rel_path
+
+
+# === SLIDE PROCESSING ===
+def process_slides(slides_data: list, resolve_audio: AudioResolver = get_audio_src) -> list:
+    """
+    Process slides and convert to JS-compatible format
+
+    Args:
+        slides_data: Slides from generate_lesson_plan / create_srs_slide
+        resolve_audio: Maps an audio rel path to the value put in the payload
+    """
+    js_slides = []
+
+    for slide in slides_data:
+        slide_obj = {'type': slide['type'], 'content': {}}
+
+        if slide['type'] in ['intro_dialogue', 'analysis']:
+            slide_obj['content']['items'] = _process_dialogue_items(slide, resolve_audio)
+        elif slide['type'] == 'quiz_recall':
+            slide_obj['content'] = _process_quiz_content(slide, resolve_audio)
+
+        js_slides.append(slide_obj)
+
+    return js_slides
+
+
+def _process_dialogue_items(slide: dict, resolve_audio: AudioResolver) -> list:
+    """Process dialogue/analysis slide items"""
+    items = []
+    data_source = slide['data'] if isinstance(slide['data'], list) else [slide['data']]
+
+    for line in data_source:
+        audio_path = line.get('audio_rel_path')
+        items.append({
+            "speaker": line.get('speaker', 'A'),
+            "english_natural": line.get('english_natural', ''),
+            "full_audio_src": resolve_audio(audio_path) if audio_path else None,
+            "chunks": _process_chunks(line.get('chunks', []), resolve_audio)
+        })
+
+    return items
+
+
+def _process_quiz_content(slide: dict, resolve_audio: AudioResolver) -> dict:
+    """Process quiz slide content"""
+    content = {
+        'target_pills': _process_chunks(slide.get('target_chunks', []), resolve_audio),
+        'target_english': slide.get('target_english', ''),
+        'context': [{"cantonese": c['cantonese']} for c in slide.get('context', [])]
+    }
+
+    # Handle audio for quiz
+    target_audio = slide.get('target_audio')
+    if target_audio:
+        content['audio_src'] = resolve_audio(target_audio)
+    elif content['target_pills']:
+        content['audio_src'] = content['target_pills'][0].get('audio_src')
+    else:
+        content['audio_src'] = None
+
+    return content
+
+
+def _process_chunks(chunk_list: list, resolve_audio: AudioResolver) -> list:
+    """Process chunks with audio and colors"""
+    processed = []
+
+    for i, chunk in enumerate(chunk_list):
+        color = chunk.get('color', CHUNK_COLORS[i % len(CHUNK_COLORS)])
+        audio_path = chunk.get('audio_rel_path')
+
+        processed.append({
+            "cantonese": chunk.get('cantonese', ''),
+            "jyutping": chunk.get('jyutping', ''),
+            "english": chunk.get('english', ''),
+            "audio_src": resolve_audio(audio_path) if audio_path else None,
+            "color": color
+        })
+
+    return processed
+
+
+# === LESSON ARTIFACTS ===
+def unit_content_hash(unit: Dict) -> str:
+    """Stable hash of a unit's content"""
+    encoded = json.dumps(unit, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def unit_lessons(unit: Dict) -> List[Tuple[int, int, str]]:
+    """(start, end, lesson_type) of every lesson the dashboard offers"""
+    count = len(unit.get('conversation', []))
+    lessons = [(0, count, 'quick')]
+    for start in range(0, count, LESSON_CHUNK_SIZE):
+        lessons.append((start, min(start + LESSON_CHUNK_SIZE, count), 'full'))
+    return lessons
+
+
+def _unit_dir(unit_id: str) -> str:
+    return os.path.join(PAYLOAD_DIR, str(unit_id))
+
+
+def _artifact_path(unit_id: str, content_hash: str, start: int, end: int, lesson_type: str) -> str:
+    # The content hash in the name makes artifacts of an edited unit miss
+    return os.path.join(_unit_dir(unit_id), f"{start}-{end}.{lesson_type}.{content_hash[:16]}.json.gz")
+
+
+def build_lesson_payload(unit: Dict, start: int, end: int, lesson_type: str) -> str:
+    """Lesson payload JSON with audio references left unresolved"""
+    lesson_plan = generate_lesson_plan(unit['conversation'][start:end], lesson_type)
+    return json.dumps(process_slides(lesson_plan, resolve_audio=_audio_ref))
+
+
+@profiled('payload.write_unit')
+def write_unit_payloads(unit: Dict, content_hash: Optional[str] = None):
+    """
+    Precompile every lesson of a unit to gzip artifacts under PAYLOAD_DIR
+
+    Artifacts from earlier versions of the unit are removed.
+
+    Args:
+        unit: Unit dictionary
+        content_hash: unit_content_hash(unit), if already known
+    """
+    unit_id = unit.get('id')
+    content_hash = content_hash or unit_content_hash(unit)
+    directory = _unit_dir(unit_id)
+    os.makedirs(directory, exist_ok=True)
+
+    written = set()
+    for start, end, lesson_type in unit_lessons(unit):
+        path = _artifact_path(unit_id, content_hash, start, end, lesson_type)
+        _write_artifact(path, build_lesson_payload(unit, start, end, lesson_type))
+        written.add(os.path.basename(path))
+
+    # Other writers' in-flight temp files are left for their os.replace
+    for name in os.listdir(directory):
+        if name not in written and not name.endswith('.tmp'):
+            _remove(os.path.join(directory, name))
+
+
+def write_lesson_payload(unit: Dict, start: int, end: int, lesson_type: str,
+                         content_hash: Optional[str] = None) -> str:
+    """
+    Build one lesson's artifact (e.g. after a miss) and return its payload
+
+    Artifacts of the same lesson from earlier versions of the unit are removed.
+    """
+    content_hash = content_hash or unit_content_hash(unit)
+    payload = build_lesson_payload(unit, start, end, lesson_type)
+    path = _artifact_path(unit.get('id'), content_hash, start, end, lesson_type)
+    directory, current = os.path.split(path)
+    os.makedirs(directory, exist_ok=True)
+    _write_artifact(path, payload)
+
+    # Leave the current artifact and other writers' temp files alone
+    prefix = f"{start}-{end}.{lesson_type}."
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name != current and not name.endswith('.tmp'):
+            _remove(os.path.join(directory, name))
+    return payload
+
+
+@profiled('payload.read')
+def read_lesson_payload(unit: Dict, start: int, end: int, lesson_type: str,
+                        content_hash: Optional[str] = None) -> Optional[str]:
+    """
+    Read a lesson's precompiled payload, or None if there is no current artifact
+
+    Args:
+        unit: Unit dictionary
+        start: First sentence index
+        end: End sentence index (exclusive)
+        lesson_type: 'full' or 'quick'
+        content_hash: unit_content_hash(unit), if already known
+
+    Returns:
+        Payload JSON with audio references still in place (see resolve_audio_refs)
+    """
+    content_hash = content_hash or unit_content_hash(unit)
+    path = _artifact_path(unit.get('id'), content_hash, start, end, lesson_type)
+    try:
+        with open(path, 'rb') as f:
+            compressed = f.read()
+        count_bytes('read.payload', len(compressed))
+        return gzip.decompress(compressed).decode('utf-8')
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        print(f"Error reading lesson payload {path}: {e}")
+        return None
+
+
+def resolve_audio_refs(payload: str, resolve_audio: AudioResolver = get_audio_src) -> str:
+    """
+    Replace audio references in a payload with playable sources
+
+    Done on the JSON text, so nothing is parsed or re-serialized.
+    """
+    resolved: Dict[str, str] = {}
+
+    def replace(match: re.Match) -> str:
+        rel_path = match.group(1)
+        if rel_path not in resolved:
+            resolved[rel_path] = json.dumps(resolve_audio(rel_path))
+        return resolved[rel_path]
+
+    return _AUDIO_REF_PATTERN.sub(replace, payload)
+
+
+def delete_unit_payloads(unit_id: str):
+    """Remove all artifacts of a unit"""
+    shutil.rmtree(_unit_dir(unit_id), ignore_errors=True)
+
+
+def _write_artifact(path: str, payload: str):
+    data = gzip.compress(payload.encode('utf-8'), compresslevel=6)
+    count_bytes('write.payload', len(data))
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove(tmp_path)
+        raise
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -2,17 +2,56 @@
 Progress Service
 Track user progress through lessons
 """
-import json
-import os
-from typing import Dict, Optional
-from core.constants import PROGRESS_PATH
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from services.storage import get_storage, StorageError
+from utils.profiling import profiled
 
-def ensure_progress_file():
-    """Ensure progress file exists"""
-    if not os.path.exists(PROGRESS_PATH):
-        os.makedirs(os.path.dirname(PROGRESS_PATH), exist_ok=True)
-        with open(PROGRESS_PATH, 'w', encoding='utf-8') as f:
-            json.dump({}, f)
+class ProgressRepository:
+    """
+    Process-wide cached snapshot of all lesson progress
+    
+    The snapshot is reloaded only when the backend's progress_version()
+    changes (another session or process wrote) and is invalidated by our
+    own writes, so a rerun that renders many lessons reads progress once.
+    Snapshots are shared between sessions and must be treated as read-only.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict] = None
+        self._version = None
+    
+    @profiled('progress.snapshot')
+    def snapshot(self) -> Dict:
+        """Get all progress as {unit_id: {lesson_key: record}}"""
+        storage = get_storage()
+        with self._lock:
+            version = storage.progress_version()
+            if self._snapshot is None or version != self._version:
+                self._snapshot = storage.get_progress()
+                self._version = version
+            return self._snapshot
+    
+    @profiled('progress.write')
+    def set_lesson(self, unit_id: str, lesson_key: str, record: Dict):
+        """Write one lesson's record through to storage"""
+        with self._lock:
+            get_storage().set_lesson_progress(unit_id, lesson_key, record)
+            self._snapshot = None
+    
+    def clear_unit(self, unit_id: str):
+        """Remove a unit's progress from storage"""
+        with self._lock:
+            get_storage().clear_unit_progress(unit_id)
+            self._snapshot = None
+
+_repository = ProgressRepository()
+
+def get_progress_repository() -> ProgressRepository:
+    """Get the process-wide progress repository"""
+    return _repository
 
 def save_lesson_progress(unit_id: str, lesson_key: str, completed: bool = True):
     """
@@ -23,24 +62,13 @@ def save_lesson_progress(unit_id: str, lesson_key: str, completed: bool = True):
         lesson_key: Lesson identifier (e.g., "lesson_1")
         completed: Whether the lesson was completed
     """
-    ensure_progress_file()
-    
     try:
-        with open(PROGRESS_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = {}
-    
-    if unit_id not in data:
-        data[unit_id] = {}
-    
-    data[unit_id][lesson_key] = {
-        'completed': completed,
-        'last_accessed': __import__('time').time()
-    }
-    
-    with open(PROGRESS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        _repository.set_lesson(unit_id, lesson_key, {
+            'completed': completed,
+            'last_accessed': time.time()
+        })
+    except StorageError as e:
+        print(f"Error saving progress: {e}")
 
 def get_lesson_progress(unit_id: str, lesson_key: str) -> Dict:
     """
@@ -53,14 +81,22 @@ def get_lesson_progress(unit_id: str, lesson_key: str) -> Dict:
     Returns:
         Dict with 'completed' and 'last_accessed' keys, or empty dict
     """
-    ensure_progress_file()
+    return get_unit_progress(unit_id).get(lesson_key, {})
+
+def get_unit_lessons_status(unit_id: str, lesson_keys: Iterable[str]) -> Dict[str, Dict]:
+    """
+    Get progress for many lessons of a unit in one call
     
-    try:
-        with open(PROGRESS_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get(unit_id, {}).get(lesson_key, {})
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
+    Args:
+        unit_id: Unit identifier
+        lesson_keys: Lesson identifiers to look up
+    
+    Returns:
+        Dict of {lesson_key: progress}, with an empty dict for lessons
+        that have no progress yet
+    """
+    progress = get_unit_progress(unit_id)
+    return {key: progress.get(key, {}) for key in lesson_keys}
 
 def get_unit_progress(unit_id: str) -> Dict:
     """
@@ -72,27 +108,38 @@ def get_unit_progress(unit_id: str) -> Dict:
     Returns:
         Dict of lesson progress
     """
-    ensure_progress_file()
+    return get_all_progress().get(unit_id, {})
+
+def get_all_progress() -> Dict:
+    """
+    Get progress for every unit in one read
     
+    Returns:
+        Dict of {unit_id: {lesson_key: progress}}
+    """
     try:
-        with open(PROGRESS_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data.get(unit_id, {})
-    except (FileNotFoundError, json.JSONDecodeError):
+        return _repository.snapshot()
+    except StorageError:
         return {}
 
-def get_unit_completion_stats(unit_id: str, total_lessons: int) -> Dict:
+def get_unit_completion_stats(unit_id: str, total_lessons: int,
+                              all_progress: Optional[Dict] = None) -> Dict:
     """
     Get completion statistics for a unit
     
     Args:
         unit_id: Unit identifier
         total_lessons: Total number of lessons in unit
+        all_progress: Snapshot from get_all_progress() to read from instead
+            of loading progress again (for listings of many units)
     
     Returns:
         Dict with 'completed' and 'total' keys
     """
-    progress = get_unit_progress(unit_id)
+    if all_progress is not None:
+        progress = all_progress.get(unit_id, {})
+    else:
+        progress = get_unit_progress(unit_id)
     completed = sum(1 for lesson_data in progress.values() 
                    if lesson_data.get('completed', False))
     
@@ -119,16 +166,7 @@ def clear_unit_progress(unit_id: str):
     Args:
         unit_id: Unit identifier
     """
-    ensure_progress_file()
-    
     try:
-        with open(PROGRESS_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if unit_id in data:
-            del data[unit_id]
-        
-        with open(PROGRESS_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass
\ No newline at end of file
+        _repository.clear_unit(unit_id)
+    except StorageError as e:
+        print(f"Error clearing progress: {e}")
\ No newline at end of file
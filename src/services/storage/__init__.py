@@ -0,0 +1,36 @@
+"""
+Storage Layer
+Pluggable persistence for units, vocab and progress
+"""
+import threading
+from typing import Optional
+from core.constants import STORAGE_BACKEND
+from services.storage.base import StorageBackend, StorageError
+
+_storage: Optional[StorageBackend] = None
+_storage_lock = threading.Lock()
+
+
+def create_storage(name: str) -> StorageBackend:
+    """
+    Create a storage backend by name
+
+    Args:
+        name: 'json' or 'sqlite'
+    """
+    if name == 'json':
+        from services.storage.json_backend import JsonStorage
+        return JsonStorage()
+    if name == 'sqlite':
+        from services.storage.sqlite_backend import SqliteStorage
+        return SqliteStorage()
+    raise ValueError(f"Unknown storage backend: {name}")
+
+
+def get_storage() -> StorageBackend:
+    """Get the process-wide backend selected by CANTO_STORAGE"""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            _storage = create_storage(STORAGE_BACKEND)
+        return _storage
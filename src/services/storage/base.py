@@ -0,0 +1,173 @@
+"""
+Storage Backend Interface
+Persistence contract shared by the unit, SRS and progress services
+"""
+import functools
+import inspect
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+
+class StorageError(Exception):
+    """A backend could not read or write its data"""
+
+
+def wraps_errors(*error_types: Type[BaseException]):
+    """
+    Class decorator making a backend raise StorageError for its own errors
+
+    Applies to the constructor and every public method, so services never
+    need to know which backend is active.
+
+    Args:
+        *error_types: Exception types the backend's storage raises
+    """
+    def wrap(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except error_types as e:
+                raise StorageError(str(e)) from e
+        return wrapper
+
+    def decorate(cls):
+        for name, member in list(vars(cls).items()):
+            if inspect.isfunction(member) and (name == '__init__' or not name.startswith('_')):
+                setattr(cls, name, wrap(member))
+        return cls
+    return decorate
+
+
+def unit_summary(unit: Dict, filename: str, mtime: float) -> Dict:
+    """
+    Build the unit index entry shown in the library
+
+    Args:
+        unit: Full unit dictionary
+        filename: Unit filename ("<id>.json")
+        mtime: Last modification time of the unit
+
+    Returns:
+        Dict with id, filename, title, topic_description, topic,
+        sentence_count, chunk_count and mtime
+    """
+    conversation = unit.get('conversation', [])
+    return {
+        'id': unit.get('id'),
+        'filename': filename,
+        'title': unit.get('title', 'Untitled'),
+        'topic_description': unit.get('topic_description', ''),
+        'topic': unit.get('topic', ''),
+        'sentence_count': len(conversation),
+        'chunk_count': sum(len(s.get('chunks', [])) for s in conversation),
+        'mtime': mtime
+    }
+
+
+class StorageBackend(ABC):
+    """
+    Persistence for units, vocab cards and lesson progress
+
+    Services keep the business logic (scheduling, filtering, stats) and
+    call these methods only to read and write data. Methods raise
+    StorageError when data cannot be read or written; services decide how
+    to report it.
+    """
+
+    # === UNITS ===
+    @abstractmethod
+    def list_unit_files(self) -> List[str]:
+        """Unit filenames ("<id>.json"), newest first"""
+
+    @abstractmethod
+    def list_unit_summaries(self) -> List[Dict]:
+        """Index entries (see unit_summary) for all units, newest first"""
+
+    def search_unit_summaries(self, query: str, offset: int, limit: int) -> Tuple[List[Dict], int]:
+        """
+        One page of index entries whose title or description contains `query`
+
+        Args:
+            query: Case-insensitive substring ('' matches everything)
+            offset: Number of matching entries to skip
+            limit: Maximum number of entries to return
+
+        Returns:
+            Tuple of (entries, total number of matches)
+        """
+        needle = query.strip().lower()
+        matches = [
+            s for s in self.list_unit_summaries()
+            if not needle
+            or needle in (s.get('title') or '').lower()
+            or needle in (s.get('topic_description') or '').lower()
+        ]
+        return matches[offset:offset + limit], len(matches)
+
+    @abstractmethod
+    def load_unit(self, filename: str) -> Optional[Dict]:
+        """Load a unit by filename, or None if it does not exist"""
+
+    @abstractmethod
+    def save_unit(self, unit_data: Dict):
+        """Insert or replace a unit (must have an 'id')"""
+
+    @abstractmethod
+    def delete_unit(self, filename: str) -> bool:
+        """Delete a unit, returning False if it did not exist"""
+
+    # === VOCAB ===
+    @abstractmethod
+    def get_card(self, cantonese: str) -> Optional[Dict]:
+        """Get a card, or None if unknown"""
+
+    @abstractmethod
+    def has_card(self, cantonese: str) -> bool:
+        """Check whether a card exists"""
+
+    @abstractmethod
+    def put_cards(self, cards: List[Dict]):
+        """Insert or replace cards"""
+
+    @abstractmethod
+    def modify_card(self, cantonese: str, mutate: Callable[[Dict], None]) -> Optional[Dict]:
+        """
+        Read-modify-write a single card
+
+        Args:
+            cantonese: Card key
+            mutate: Called with the current card, edits it in place
+
+        Returns:
+            The updated card, or None if the card does not exist
+        """
+
+    @abstractmethod
+    def due_cards(self, now: float, limit: Optional[int] = None) -> List[Dict]:
+        """Cards with next_review <= now, most overdue first"""
+
+    @abstractmethod
+    def vocab_stats(self, now: float) -> Dict:
+        """Dict with 'total', 'due' and 'learned' counts"""
+
+    # === PROGRESS ===
+    @abstractmethod
+    def get_progress(self) -> Dict:
+        """All progress as {unit_id: {lesson_key: record}}"""
+
+    @abstractmethod
+    def progress_version(self):
+        """Cheap token that changes whenever progress is written (by anyone)"""
+
+    @abstractmethod
+    def get_unit_progress(self, unit_id: str) -> Dict:
+        """Progress for one unit as {lesson_key: record}"""
+
+    @abstractmethod
+    def set_lesson_progress(self, unit_id: str, lesson_key: str, record: Dict):
+        """Insert or replace the record for one lesson"""
+
+    @abstractmethod
+    def clear_unit_progress(self, unit_id: str):
+        """Remove all progress for a unit"""
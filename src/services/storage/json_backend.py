@@ -0,0 +1,184 @@
+"""
+JSON Storage Backend
+One JSON file per unit, journaled vocab store and buffered progress file
+"""
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+from core.constants import DATA_DIR, PROGRESS_PATH, UNIT_INDEX_PATH
+from services.storage.base import StorageBackend, unit_summary, wraps_errors
+from services.storage.progress_buffer import ProgressBuffer
+from services.vocab_store import get_vocab_store
+from utils.durable import atomic_write_json, file_lock
+from utils.profiling import count_bytes
+
+
+@wraps_errors(OSError, json.JSONDecodeError)
+class JsonStorage(StorageBackend):
+    """File-based storage under data/ (the default backend)"""
+
+    def __init__(self, data_dir: str = DATA_DIR, progress_path: str = PROGRESS_PATH,
+                 index_path: str = UNIT_INDEX_PATH):
+        self.data_dir = data_dir
+        self.progress_path = progress_path
+        self.index_path = index_path
+        self.vocab = get_vocab_store()
+        self.progress = ProgressBuffer(progress_path)
+        self._index_lock = threading.Lock()
+        self._index: Optional[Dict[str, Dict]] = None
+        self._index_signature = None
+
+    # === UNITS ===
+    def list_unit_files(self) -> List[str]:
+        os.makedirs(self.data_dir, exist_ok=True)
+        return sorted(
+            [f for f in os.listdir(self.data_dir) if f.endswith('.json')],
+            reverse=True  # Newest first
+        )
+
+    def list_unit_summaries(self) -> List[Dict]:
+        """
+        Read the unit index, reconciled against one directory scan
+
+        Units saved through save_unit are already indexed; files without an
+        entry (copied in by hand, older installs) or whose mtime differs
+        from their entry (edited outside save_unit) are summarized again.
+        """
+        with self._index_lock, file_lock(self.index_path):
+            index = dict(self._read_index())
+            mtimes = self._unit_file_mtimes()
+
+            # Entries from before 'topic' was indexed are refreshed once too
+            changed = [
+                filename for filename, mtime in mtimes.items()
+                if index.get(filename, {}).get('mtime') != mtime or 'topic' not in index[filename]
+            ]
+            removed = index.keys() - mtimes.keys()
+            for filename in changed:
+                try:
+                    unit = self.load_unit(filename)
+                except ValueError as e:
+                    print(f"Skipping unreadable unit {filename}: {e}")
+                    index.pop(filename, None)
+                    continue
+                if unit:
+                    index[filename] = unit_summary(unit, filename, mtimes[filename])
+            for filename in removed:
+                del index[filename]
+            if changed or removed:
+                self._write_index(index)
+
+            return [dict(index[f]) for f in sorted(index, reverse=True)]
+
+    def _unit_file_mtimes(self) -> Dict[str, float]:
+        """Modification time of every unit file, from one directory scan"""
+        os.makedirs(self.data_dir, exist_ok=True)
+        with os.scandir(self.data_dir) as entries:
+            return {
+                entry.name: entry.stat().st_mtime
+                for entry in entries if entry.name.endswith('.json') and entry.is_file()
+            }
+
+    def load_unit(self, filename: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(self.data_dir, filename), 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        count_bytes('read.unit', len(raw))
+        return json.loads(raw)
+
+    def save_unit(self, unit_data: Dict):
+        filepath = os.path.join(self.data_dir, f"{unit_data['id']}.json")
+        with file_lock(filepath):
+            atomic_write_json(filepath, unit_data, indent=2)
+
+        filename = os.path.basename(filepath)
+        with self._index_lock, file_lock(self.index_path):
+            index = dict(self._read_index())
+            index[filename] = unit_summary(unit_data, filename, os.path.getmtime(filepath))
+            self._write_index(index)
+
+    def delete_unit(self, filename: str) -> bool:
+        filepath = os.path.join(self.data_dir, filename)
+        with self._index_lock, file_lock(self.index_path):
+            index = dict(self._read_index())
+            if index.pop(filename, None) is not None:
+                self._write_index(index)
+
+        if os.path.exists(filepath):
+            os.remove(filepath)
+            return True
+        return False
+
+    def _index_file_signature(self):
+        try:
+            st = os.stat(self.index_path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _read_index(self) -> Dict[str, Dict]:
+        """Load the index, reusing the parsed copy while the file is unchanged"""
+        signature = self._index_file_signature()
+        if self._index is None or signature != self._index_signature:
+            try:
+                with open(self.index_path, 'rb') as f:
+                    raw = f.read()
+                count_bytes('read.unit_index', len(raw))
+                self._index = json.loads(raw)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._index = {}
+            self._index_signature = signature
+        return self._index
+
+    def _write_index(self, index: Dict[str, Dict]):
+        atomic_write_json(self.index_path, index)
+        self._index = index
+        self._index_signature = self._index_file_signature()
+
+    # === VOCAB ===
+    def get_card(self, cantonese: str) -> Optional[Dict]:
+        return self.vocab.get(cantonese)
+
+    def has_card(self, cantonese: str) -> bool:
+        return self.vocab.contains(cantonese)
+
+    def put_cards(self, cards: List[Dict]):
+        self.vocab.put_many(cards)
+
+    def modify_card(self, cantonese: str, mutate: Callable[[Dict], None]) -> Optional[Dict]:
+        with self.vocab.transaction():
+            card = self.vocab.get(cantonese)
+            if not card:
+                return None
+            mutate(card)
+            self.vocab.put(card)
+            return card
+
+    def due_cards(self, now: float, limit: Optional[int] = None) -> List[Dict]:
+        return self.vocab.due_cards(now, limit)
+
+    def vocab_stats(self, now: float) -> Dict:
+        return {
+            'total': len(self.vocab),
+            'due': self.vocab.count_due(now),
+            'learned': self.vocab.learned_count()
+        }
+
+    # === PROGRESS ===
+    def get_progress(self) -> Dict:
+        return self.progress.read()
+
+    def progress_version(self):
+        return self.progress.version()
+
+    def get_unit_progress(self, unit_id: str) -> Dict:
+        return self.get_progress().get(unit_id, {})
+
+    def set_lesson_progress(self, unit_id: str, lesson_key: str, record: Dict):
+        self.progress.set_lesson(unit_id, lesson_key, record)
+
+    def clear_unit_progress(self, unit_id: str):
+        self.progress.clear_unit(unit_id)
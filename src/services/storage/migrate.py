@@ -0,0 +1,62 @@
+"""
+JSON to SQLite Migrator
+One-shot copy of units, vocab and progress into the SQLite backend
+
+Usage (from src/):
+    python -m services.storage.migrate [--db PATH]
+
+Then run the app with CANTO_STORAGE=sqlite. The JSON files are left in
+place; re-running the migration overwrites rows with the JSON contents.
+"""
+import argparse
+from typing import Dict
+from core.constants import DB_PATH
+from services.storage.base import StorageError
+from services.storage.json_backend import JsonStorage
+from services.storage.sqlite_backend import SqliteStorage
+
+
+def migrate_json_to_sqlite(db_path: str = DB_PATH) -> Dict:
+    """
+    Copy all JSON data into a SQLite database
+
+    Args:
+        db_path: Target database path
+
+    Returns:
+        Dict with counts of migrated 'units', 'cards' and 'progress' rows
+    """
+    source = JsonStorage()
+    target = SqliteStorage(db_path)
+    counts = {'units': 0, 'cards': 0, 'progress': 0}
+
+    for filename in source.list_unit_files():
+        try:
+            unit = source.load_unit(filename)
+        except StorageError as e:
+            print(f"Skipping unreadable unit {filename}: {e}")
+            continue
+        if unit and unit.get('id'):
+            target.save_unit(unit)
+            counts['units'] += 1
+
+    cards = source.vocab.cards()
+    target.put_cards(cards)
+    counts['cards'] = len(cards)
+
+    for unit_id, lessons in source.get_progress().items():
+        for lesson_key, record in lessons.items():
+            target.set_lesson_progress(unit_id, lesson_key, record)
+            counts['progress'] += 1
+
+    return counts
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Migrate JSON data files to SQLite")
+    parser.add_argument('--db', default=DB_PATH, help="Target database path")
+    args = parser.parse_args()
+
+    result = migrate_json_to_sqlite(args.db)
+    print(f"✅ Migrated {result['units']} units, {result['cards']} cards, "
+          f"{result['progress']} progress entries into {args.db}")
@@ -0,0 +1,114 @@
+"""
+Progress Buffer
+Write-behind progress.json: mutations are journaled, then flushed together
+"""
+import atexit
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+from core.constants import PROGRESS_PATH, PROGRESS_JOURNAL_PATH, PROGRESS_FLUSH_DELAY
+from utils.durable import atomic_write_json, file_lock
+from utils.journal import Journal
+from utils.profiling import count_bytes
+
+
+class ProgressBuffer:
+    """
+    progress.json with a write-behind journal
+
+    Each mutation is appended (and fsynced) to a small journal, so it is
+    durable immediately. A debounce timer then folds every pending mutation
+    into progress.json with a single atomic rewrite; a burst of lesson
+    starts and completions costs one rewrite instead of one each. Reads
+    always see progress.json plus the journal, and a journal left behind
+    by a crash is replayed and flushed on the next start. Appends, flushes
+    and reads hold an advisory lock, so several processes can share it.
+    """
+
+    def __init__(self, path: str = PROGRESS_PATH, journal_path: str = PROGRESS_JOURNAL_PATH,
+                 flush_delay: float = PROGRESS_FLUSH_DELAY):
+        self.path = path
+        self.journal = Journal(journal_path)
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+
+        atexit.register(self.flush)
+        if self.journal.size():
+            self._schedule_flush()
+
+    def read(self) -> Dict:
+        """Current progress as {unit_id: {lesson_key: record}}"""
+        with self._lock, file_lock(self.path):
+            records, _ = self.journal.read_from(0)
+            return _apply(self._read_base(), records)
+
+    def version(self):
+        """Token that changes whenever progress.json or the journal changes"""
+        try:
+            st = os.stat(self.path)
+            base = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            base = None
+        return (base, self.journal.size())
+
+    def set_lesson(self, unit_id: str, lesson_key: str, record: Dict):
+        """Buffer a lesson record"""
+        self._append({'op': 'set', 'unit_id': unit_id, 'lesson_key': lesson_key, 'record': record})
+
+    def clear_unit(self, unit_id: str):
+        """Buffer removal of a unit's progress"""
+        self._append({'op': 'clear', 'unit_id': unit_id})
+
+    def flush(self):
+        """Fold pending mutations into progress.json and empty the journal"""
+        with self._lock, file_lock(self.path):
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+            records, _ = self.journal.read_from(0)
+            if not records:
+                return
+            atomic_write_json(self.path, _apply(self._read_base(), records), indent=2)
+            self.journal.truncate()
+
+    def _append(self, record: Dict):
+        with self._lock, file_lock(self.path):
+            self.journal.append([record], sync=True)
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """(Re)start the debounce timer"""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        except OSError as e:
+            print(f"Error flushing progress: {e}")
+
+    def _read_base(self) -> Dict:
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            count_bytes('read.progress', len(raw))
+            return json.loads(raw)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+
+def _apply(data: Dict, records: List[Dict]) -> Dict:
+    """Replay journal records onto a progress dict"""
+    for record in records:
+        if record.get('op') == 'set':
+            data.setdefault(record['unit_id'], {})[record['lesson_key']] = record['record']
+        elif record.get('op') == 'clear':
+            data.pop(record['unit_id'], None)
+    return data
@@ -0,0 +1,305 @@
+"""
+SQLite Storage Backend
+Indexed tables in a single WAL-mode database, safe for concurrent sessions
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+from core.constants import DB_PATH
+from services.storage.base import StorageBackend, unit_summary, wraps_errors
+from utils.profiling import count_bytes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS units (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    topic_description TEXT,
+    topic TEXT,
+    sentence_count INTEGER NOT NULL DEFAULT 0,
+    chunk_count INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cards (
+    cantonese TEXT PRIMARY KEY,
+    next_review REAL NOT NULL DEFAULT 0,
+    reps INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cards_next_review ON cards (next_review);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS progress (
+    unit_id TEXT NOT NULL,
+    lesson_key TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    last_accessed REAL,
+    PRIMARY KEY (unit_id, lesson_key)
+);
+"""
+
+
+SUMMARY_COLUMNS = "id, title, topic_description, topic, sentence_count, chunk_count, updated_at"
+
+# Unit index columns added after the first release, with their definitions
+ADDED_COLUMNS = {
+    'sentence_count': "INTEGER NOT NULL DEFAULT 0",
+    'chunk_count': "INTEGER NOT NULL DEFAULT 0",
+    'topic': "TEXT",
+}
+
+
+def _unit_id(filename: str) -> str:
+    return filename[:-len('.json')] if filename.endswith('.json') else filename
+
+
+@wraps_errors(sqlite3.Error, OSError, json.JSONDecodeError)
+class SqliteStorage(StorageBackend):
+    """
+    SQLite storage with one connection per thread
+
+    Writes are short transactions, so Streamlit sessions in one process and
+    separate worker processes can share the database without lost updates.
+    """
+
+    def __init__(self, db_path: str = DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn().executescript(SCHEMA)
+        self._add_missing_columns()
+
+    def _add_missing_columns(self):
+        """Upgrade databases created before the unit index columns existed"""
+        conn = self._conn()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(units)")}
+        for column, definition in ADDED_COLUMNS.items():
+            if column not in columns:
+                conn.execute(f"ALTER TABLE units ADD COLUMN {column} {definition}")
+                # Backfill from the stored JSON
+                for unit_id, data in conn.execute("SELECT id, data FROM units").fetchall():
+                    summary = unit_summary(json.loads(data), f"{unit_id}.json", 0)
+                    conn.execute(
+                        f"UPDATE units SET {column} = ? WHERE id = ?", (summary[column], unit_id)
+                    )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT, taking the write lock up front"""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    # === UNITS ===
+    def list_unit_files(self) -> List[str]:
+        rows = self._conn().execute("SELECT id FROM units ORDER BY id DESC").fetchall()
+        return [f"{row[0]}.json" for row in rows]
+
+    def list_unit_summaries(self) -> List[Dict]:
+        return self._summaries(self._conn().execute(
+            f"SELECT {SUMMARY_COLUMNS} FROM units ORDER BY id DESC"
+        ).fetchall())
+
+    def search_unit_summaries(self, query: str, offset: int, limit: int) -> Tuple[List[Dict], int]:
+        needle = query.strip()
+        where, params = "", ()
+        if needle:
+            # Match the query literally, like the base implementation does
+            escaped = needle.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            pattern = f"%{escaped}%"
+            where = ("WHERE COALESCE(title, '') LIKE ? ESCAPE '\\' "
+                     "OR COALESCE(topic_description, '') LIKE ? ESCAPE '\\'")
+            params = (pattern, pattern)
+        conn = self._conn()
+        total = conn.execute(f"SELECT COUNT(*) FROM units {where}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT {SUMMARY_COLUMNS} FROM units {where} ORDER BY id DESC LIMIT ? OFFSET ?",
+            params + (limit, offset)
+        ).fetchall()
+        return self._summaries(rows), total
+
+    @staticmethod
+    def _summaries(rows: List[tuple]) -> List[Dict]:
+        return [
+            {
+                'id': unit_id,
+                'filename': f"{unit_id}.json",
+                'title': title or 'Untitled',
+                'topic_description': topic_description or '',
+                'topic': topic or '',
+                'sentence_count': sentence_count,
+                'chunk_count': chunk_count,
+                'mtime': updated_at
+            }
+            for unit_id, title, topic_description, topic, sentence_count, chunk_count, updated_at in rows
+        ]
+
+    def load_unit(self, filename: str) -> Optional[Dict]:
+        row = self._conn().execute(
+            "SELECT data FROM units WHERE id = ?", (_unit_id(filename),)
+        ).fetchone()
+        if not row:
+            return None
+        count_bytes('read.unit', len(row[0]))
+        return json.loads(row[0])
+
+    def save_unit(self, unit_data: Dict):
+        unit_id = str(unit_data['id'])
+        summary = unit_summary(unit_data, f"{unit_id}.json", time.time())
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO units "
+                "(id, title, topic_description, topic, sentence_count, chunk_count, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    unit_id,
+                    unit_data.get('title'),
+                    unit_data.get('topic_description'),
+                    unit_data.get('topic'),
+                    summary['sentence_count'],
+                    summary['chunk_count'],
+                    summary['mtime'],
+                    json.dumps(unit_data, ensure_ascii=False)
+                )
+            )
+
+    def delete_unit(self, filename: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM units WHERE id = ?", (_unit_id(filename),))
+            return cursor.rowcount > 0
+
+    # === VOCAB ===
+    def get_card(self, cantonese: str) -> Optional[Dict]:
+        row = self._conn().execute(
+            "SELECT data FROM cards WHERE cantonese = ?", (cantonese,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def has_card(self, cantonese: str) -> bool:
+        row = self._conn().execute(
+            "SELECT 1 FROM cards WHERE cantonese = ?", (cantonese,)
+        ).fetchone()
+        return row is not None
+
+    def put_cards(self, cards: List[Dict]):
+        if not cards:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cards (cantonese, next_review, reps, data) VALUES (?, ?, ?, ?)",
+                [self._card_row(card) for card in cards]
+            )
+
+    def modify_card(self, cantonese: str, mutate: Callable[[Dict], None]) -> Optional[Dict]:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT data FROM cards WHERE cantonese = ?", (cantonese,)
+            ).fetchone()
+            if not row:
+                return None
+            card = json.loads(row[0])
+            mutate(card)
+            conn.execute(
+                "UPDATE cards SET next_review = ?, reps = ?, data = ? WHERE cantonese = ?",
+                self._card_row(card)[1:] + (cantonese,)
+            )
+            return card
+
+    def due_cards(self, now: float, limit: Optional[int] = None) -> List[Dict]:
+        rows = self._conn().execute(
+            "SELECT data FROM cards WHERE next_review <= ? ORDER BY next_review, cantonese LIMIT ?",
+            (now, -1 if limit is None else limit)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def vocab_stats(self, now: float) -> Dict:
+        conn = self._conn()
+        return {
+            'total': conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0],
+            'due': conn.execute(
+                "SELECT COUNT(*) FROM cards WHERE next_review <= ?", (now,)
+            ).fetchone()[0],
+            'learned': conn.execute("SELECT COUNT(*) FROM cards WHERE reps > 0").fetchone()[0]
+        }
+
+    @staticmethod
+    def _card_row(card: Dict) -> tuple:
+        return (
+            card['cantonese'],
+            card.get('next_review') or 0,
+            card.get('reps', 0),
+            json.dumps(card, ensure_ascii=False)
+        )
+
+    # === PROGRESS ===
+    def get_progress(self) -> Dict:
+        data = {}
+        rows = self._conn().execute(
+            "SELECT unit_id, lesson_key, completed, last_accessed FROM progress"
+        ).fetchall()
+        for unit_id, lesson_key, completed, last_accessed in rows:
+            data.setdefault(unit_id, {})[lesson_key] = {
+                'completed': bool(completed),
+                'last_accessed': last_accessed
+            }
+        return data
+
+    def progress_version(self):
+        row = self._conn().execute(
+            "SELECT value FROM meta WHERE key = 'progress_rev'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _bump_progress_version(conn: sqlite3.Connection):
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('progress_rev', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+        )
+
+    def get_unit_progress(self, unit_id: str) -> Dict:
+        rows = self._conn().execute(
+            "SELECT lesson_key, completed, last_accessed FROM progress WHERE unit_id = ?",
+            (unit_id,)
+        ).fetchall()
+        return {
+            lesson_key: {'completed': bool(completed), 'last_accessed': last_accessed}
+            for lesson_key, completed, last_accessed in rows
+        }
+
+    def set_lesson_progress(self, unit_id: str, lesson_key: str, record: Dict):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO progress (unit_id, lesson_key, completed, last_accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (unit_id, lesson_key, int(record.get('completed', False)), record.get('last_accessed'))
+            )
+            self._bump_progress_version(conn)
+
+    def clear_unit_progress(self, unit_id: str):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM progress WHERE unit_id = ?", (unit_id,))
+            self._bump_progress_version(conn)
@@ -2,10 +2,12 @@
 Unit Service
 Handles loading, saving, and listing units
 """
-import json
 import os
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from core.constants import DATA_DIR
+from services.storage import get_storage, StorageError
+from services.payload_service import write_unit_payloads, delete_unit_payloads
+from utils.profiling import profiled
 
 
 def ensure_data_dir():
@@ -15,49 +17,86 @@ def ensure_data_dir():
 
 def get_all_units() -> List[str]:
     """Get list of all unit filenames"""
-    ensure_data_dir()
-    return sorted(
-        [f for f in os.listdir(DATA_DIR) if f.endswith('.json')],
-        reverse=True  # Newest first
-    )
+    return get_storage().list_unit_files()
 
 
+@profiled('units.summaries')
+def get_unit_summaries() -> List[Dict]:
+    """
+    Get index entries for all units, newest first
+
+    Each entry has id, filename, title, topic_description, topic,
+    sentence_count, chunk_count and mtime, so listings never load full
+    unit files.
+    """
+    try:
+        return get_storage().list_unit_summaries()
+    except StorageError as e:
+        print(f"Error reading unit index: {e}")
+        return []
+
+
+@profiled('units.search')
+def search_unit_summaries(query: str = '', page: int = 0, page_size: int = 12) -> Tuple[List[Dict], int]:
+    """
+    Get one page of unit index entries matching a title/description search
+
+    Args:
+        query: Case-insensitive text to look for ('' for all units)
+        page: Zero-based page number
+        page_size: Entries per page
+
+    Returns:
+        Tuple of (entries on the page, total number of matches)
+    """
+    try:
+        return get_storage().search_unit_summaries(query, page * page_size, page_size)
+    except StorageError as e:
+        print(f"Error searching unit index: {e}")
+        return [], 0
+
+
+@profiled('units.load')
 def load_unit(filename: str) -> Optional[Dict]:
     """Load a specific unit by filename"""
     try:
-        filepath = os.path.join(DATA_DIR, filename)
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        unit = get_storage().load_unit(filename)
+        if unit is None:
+            print(f"Error loading unit {filename}: not found")
+        return unit
+    except StorageError as e:
         print(f"Error loading unit {filename}: {e}")
         return None
 
 
+@profiled('units.save')
 def save_unit(unit_data: Dict) -> bool:
     """Save a unit to disk"""
     try:
-        ensure_data_dir()
         unit_id = unit_data.get('id')
         if not unit_id:
             raise ValueError("Unit must have an 'id' field")
 
-        filepath = os.path.join(DATA_DIR, f"{unit_id}.json")
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(unit_data, f, ensure_ascii=False, indent=2)
-        return True
+        get_storage().save_unit(unit_data)
     except Exception as e:
         print(f"Error saving unit: {e}")
         return False
 
+    # The unit is saved either way; lessons compile on first view if this fails
+    try:
+        write_unit_payloads(unit_data)
+    except Exception as e:
+        print(f"Error precompiling lessons for unit {unit_id}: {e}")
+    return True
+
 
 def delete_unit(filename: str) -> bool:
     """Delete a unit file"""
     try:
-        filepath = os.path.join(DATA_DIR, filename)
-        if os.path.exists(filepath):
-            os.remove(filepath)
-            return True
-        return False
+        deleted = get_storage().delete_unit(filename)
+        unit_id = filename[:-len('.json')] if filename.endswith('.json') else filename
+        delete_unit_payloads(unit_id)
+        return deleted
     except Exception as e:
         print(f"Error deleting unit {filename}: {e}")
         return False
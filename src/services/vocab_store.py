@@ -0,0 +1,197 @@
+"""
+Vocab Store
+In-memory, cantonese-keyed vocabulary backed by vocab.json plus a journal
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from core.constants import VOCAB_PATH, VOCAB_JOURNAL_PATH, VOCAB_COMPACT_EVERY
+from services.due_index import DueIndex
+from utils.durable import atomic_write_json, file_lock
+from utils.journal import Journal
+from utils.profiling import count_bytes
+
+
+class VocabStore:
+    """
+    Vocabulary loaded once per process and kept in a dict
+
+    vocab.json holds the last compacted snapshot. Every write appends the
+    changed cards to a journal instead of rewriting the snapshot; once the
+    journal holds `compact_every` entries it is folded back into vocab.json.
+    Other processes' writes are picked up by tailing the journal; writers
+    serialize on an advisory lock so concurrent sessions never lose grades.
+    A DueIndex over next_review and a running learned count are kept in
+    step with the dict, so review stats never scan the deck.
+    """
+
+    def __init__(self, path: str, journal_path: str, compact_every: int = VOCAB_COMPACT_EVERY):
+        self.path = path
+        self.journal = Journal(journal_path)
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._cards: Dict[str, Dict] = {}
+        self._due_index = DueIndex()
+        self._learned = 0
+        self._loaded = False
+        self._base_signature = None
+        self._offset = 0
+        self._journal_entries = 0
+
+    def get(self, cantonese: str) -> Optional[Dict]:
+        """Get a copy of a card, or None if unknown"""
+        with self._lock:
+            self._refresh()
+            card = self._cards.get(cantonese)
+            return dict(card) if card else None
+
+    def contains(self, cantonese: str) -> bool:
+        """Check whether a card exists"""
+        with self._lock:
+            self._refresh()
+            return cantonese in self._cards
+
+    def cards(self) -> List[Dict]:
+        """Get copies of all cards in insertion order"""
+        with self._lock:
+            self._refresh()
+            return [dict(card) for card in self._cards.values()]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._cards)
+
+    def due_cards(self, now: float, limit: Optional[int] = None) -> List[Dict]:
+        """Get copies of cards due at `now`, most overdue first"""
+        with self._lock:
+            self._refresh()
+            return [dict(self._cards[c]) for c in self._due_index.due(now, limit)]
+
+    def count_due(self, now: float) -> int:
+        """Number of cards due at `now`"""
+        with self._lock:
+            self._refresh()
+            return self._due_index.count_due(now)
+
+    def learned_count(self) -> int:
+        """Number of cards reviewed successfully at least once"""
+        with self._lock:
+            self._refresh()
+            return self._learned
+
+    @contextmanager
+    def transaction(self):
+        """
+        Hold the store's cross-process write lock, with fresh data loaded
+
+        Use around read-modify-write sequences so another session cannot
+        write the same card in between.
+        """
+        with self._lock, file_lock(self.path):
+            self._refresh()
+            yield self
+
+    def put(self, card: Dict):
+        """Insert or replace a single card"""
+        self.put_many([card])
+
+    def put_many(self, cards: List[Dict]):
+        """
+        Insert or replace cards with one journal append
+
+        Args:
+            cards: Card dictionaries, each with a 'cantonese' key
+        """
+        if not cards:
+            return
+
+        with self.transaction():
+            self.journal.append([{'op': 'put', 'card': dict(card)} for card in cards], sync=True)
+            # Our own records come back through the journal like anyone else's
+            self._replay()
+
+            if self._journal_entries >= self.compact_every:
+                self.compact()
+
+    def compact(self):
+        """Fold the journal into vocab.json and truncate it"""
+        with self.transaction():
+            atomic_write_json(self.path, list(self._cards.values()), indent=2)
+            self.journal.truncate()
+
+            self._base_signature = self._signature()
+            self._offset = 0
+            self._journal_entries = 0
+
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _refresh(self):
+        """Pick up changes made since the last call, by us or other processes"""
+        journal_size = self.journal.size()
+        if (not self._loaded
+                or self._signature() != self._base_signature
+                or journal_size < self._offset):
+            # First use, or another process compacted under us
+            self._reload()
+        elif journal_size > self._offset:
+            self._replay()
+
+    def _reload(self):
+        self._base_signature = self._signature()
+        try:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            count_bytes('read.vocab', len(raw))
+            vocab = json.loads(raw)
+        except FileNotFoundError:
+            vocab = []
+        except json.JSONDecodeError as e:
+            print(f"Error loading vocab: {e}")
+            vocab = []
+
+        self._cards = {card['cantonese']: card for card in vocab if 'cantonese' in card}
+        self._due_index.rebuild(
+            (c, card.get('next_review') or 0) for c, card in self._cards.items()
+        )
+        self._learned = sum(1 for card in self._cards.values() if card.get('reps', 0) > 0)
+        self._offset = 0
+        self._journal_entries = 0
+        self._loaded = True
+        self._replay()
+
+    def _replay(self):
+        records, self._offset = self.journal.read_from(self._offset)
+        for record in records:
+            if record.get('op') == 'put':
+                self._apply_put(record['card'])
+        self._journal_entries += len(records)
+
+    def _apply_put(self, card: Dict):
+        old = self._cards.get(card['cantonese'])
+        if old and old.get('reps', 0) > 0:
+            self._learned -= 1
+        if card.get('reps', 0) > 0:
+            self._learned += 1
+        self._cards[card['cantonese']] = card
+        self._due_index.set(card['cantonese'], card.get('next_review') or 0)
+
+
+_store: Optional[VocabStore] = None
+_store_lock = threading.Lock()
+
+
+def get_vocab_store() -> VocabStore:
+    """Get the process-wide vocab store"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = VocabStore(VOCAB_PATH, VOCAB_JOURNAL_PATH)
+        return _store
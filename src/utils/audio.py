@@ -4,13 +4,30 @@ Handle audio file encoding and conversion
 """
 import os
 import base64
-from core.constants import AUDIO_DIR
+import json
+import mimetypes
+import stat
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+from core.constants import (
+    AUDIO_DIR, SHARED_AUDIO_SUBDIR, AUDIO_DELIVERY, AUDIO_BASE_URL, AUDIO_CACHE_MAX_BYTES,
+    AUDIO_VERSION_PATH
+)
+from utils.cache import LRUCache
+from utils.durable import atomic_write_json, file_lock
+from utils.profiling import count_bytes, timed
+
+# Shared by all sessions in the process; base64 strings are ASCII, so len() is bytes
+_b64_cache = LRUCache(AUDIO_CACHE_MAX_BYTES)
 
 
 def get_b64_audio(rel_path: str) -> str:
     """
     Convert audio file to base64 string for HTML embedding
 
+    Encoded strings are cached per process, keyed by (path, mtime, size),
+    so a regenerated file is re-read automatically.
+
     Args:
         rel_path: Relative path to audio file (e.g., "unit_id/chunk_0_1.mp3")
 
@@ -22,28 +39,122 @@ def get_b64_audio(rel_path: str) -> str:
 
     full_path = os.path.join(AUDIO_DIR, rel_path)
 
-    if not os.path.exists(full_path) or not os.path.isfile(full_path):
+    try:
+        st = os.stat(full_path)
+    except OSError:
         return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    key = (full_path, st.st_mtime_ns, st.st_size)
+    cached = _b64_cache.get(key)
+    if cached is not None:
+        return cached
 
     try:
-        with open(full_path, "rb") as f:
-            audio_data = f.read()
-            return base64.b64encode(audio_data).decode('utf-8')
+        with timed('audio.b64_encode'):
+            with open(full_path, "rb") as f:
+                audio_data = f.read()
+            encoded = base64.b64encode(audio_data).decode('utf-8')
+        count_bytes('read.audio', len(audio_data))
     except Exception as e:
         print(f"Error encoding audio {rel_path}: {e}")
         return None
 
+    _b64_cache.put(key, encoded)
+    return encoded
+
 
-def ensure_audio_dir(unit_id: str) -> str:
+def get_audio_cache_stats() -> Dict:
+    """Hit/miss counters and size of the base64 audio cache"""
+    return _b64_cache.stats()
+
+
+def get_audio_url(rel_path: str) -> Optional[str]:
     """
-    Ensure audio directory exists for a unit
+    Build a cacheable URL for an audio file
+
+    The file's mtime is appended as a version so regenerated audio is
+    never served from a stale browser cache.
 
     Args:
-        unit_id: Unit identifier
+        rel_path: Relative path to audio file
 
     Returns:
-        Path to the unit's audio directory
+        URL string, or None if file not found
+    """
+    if not rel_path:
+        return None
+
+    full_path = os.path.join(AUDIO_DIR, rel_path)
+    if not os.path.isfile(full_path):
+        return None
+
+    if AUDIO_BASE_URL:
+        base_url = AUDIO_BASE_URL.rstrip('/')
+    else:
+        from utils.audio_server import start_audio_server
+        base_url = start_audio_server()
+
+    return f"{base_url}/{quote(rel_path)}?v={os.stat(full_path).st_mtime_ns}"
+
+
+def get_audio_src(rel_path: str) -> Optional[str]:
     """
-    unit_audio_dir = os.path.join(AUDIO_DIR, unit_id)
-    os.makedirs(unit_audio_dir, exist_ok=True)
-    return unit_audio_dir
\ No newline at end of file
+    Get a playable source for an audio file, depending on AUDIO_DELIVERY
+
+    Args:
+        rel_path: Relative path to audio file
+
+    Returns:
+        URL ('url' mode) or data URI ('inline' mode), or None if not found
+    """
+    if AUDIO_DELIVERY == 'url':
+        return get_audio_url(rel_path)
+
+    b64 = get_b64_audio(rel_path)
+    if not b64:
+        return None
+    mime = mimetypes.guess_type(rel_path)[0] or 'audio/mpeg'
+    return f"data:{mime};base64,{b64}"
+
+
+def get_audio_version() -> int:
+    """
+    Get the shared audio version, part of derived-data cache keys
+
+    Blobs are shared by every unit that speaks the same text, so rewriting
+    one can change any unit's audio. The version is kept on disk so every
+    process sees a regeneration.
+    """
+    try:
+        with open(AUDIO_VERSION_PATH, 'r', encoding='utf-8') as f:
+            return int(json.load(f))
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Error reading audio version: {e}")
+        return 0
+
+
+def bump_audio_version():
+    """Record that existing audio blobs were rewritten"""
+    with file_lock(AUDIO_VERSION_PATH):
+        atomic_write_json(AUDIO_VERSION_PATH, get_audio_version() + 1)
+
+
+def shared_audio_path(content_key: str, extension: str = "mp3") -> Tuple[str, str]:
+    """
+    Locate a content-addressed audio blob, creating its directory
+
+    Args:
+        content_key: Hex digest identifying the utterance
+        extension: File extension without the dot
+
+    Returns:
+        Tuple of (rel_path for unit data, absolute file path)
+    """
+    rel_path = f"{SHARED_AUDIO_SUBDIR}/{content_key[:2]}/{content_key}.{extension}"
+    full_path = os.path.join(AUDIO_DIR, rel_path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    return rel_path, full_path
\ No newline at end of file
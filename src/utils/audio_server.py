@@ -0,0 +1,139 @@
+"""
+Audio Server
+Small local HTTP endpoint that serves AUDIO_DIR with ETag and Range support
+"""
+import mimetypes
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import unquote, urlparse
+from core.constants import AUDIO_DIR, AUDIO_SERVER_HOST, AUDIO_SERVER_PORT
+
+AUDIO_ROUTE = "/audio/"
+
+_base_url: Optional[str] = None
+_server_lock = threading.Lock()
+
+
+class AudioRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET/HEAD /audio/<rel_path> from AUDIO_DIR"""
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._send_common_headers()
+        self.send_header("Access-Control-Allow-Methods", "GET, HEAD, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Range, If-None-Match")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass  # Keep the Streamlit console quiet
+
+    def _serve(self, send_body: bool):
+        full_path = self._resolve(urlparse(self.path).path)
+        if not full_path:
+            self.send_error(404)
+            return
+
+        st = os.stat(full_path)
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self._send_common_headers(etag)
+            self.end_headers()
+            return
+
+        start, end = 0, st.st_size - 1
+        range_header = self.headers.get("Range")
+        if range_header:
+            parsed = _parse_range(range_header, st.st_size)
+            if parsed is None:
+                self.send_response(416)
+                self._send_common_headers(etag)
+                self.send_header("Content-Range", f"bytes */{st.st_size}")
+                self.end_headers()
+                return
+            start, end = parsed
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{st.st_size}")
+        else:
+            self.send_response(200)
+
+        length = end - start + 1
+        self._send_common_headers(etag)
+        self.send_header("Content-Type", mimetypes.guess_type(full_path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+        if send_body:
+            with open(full_path, "rb") as f:
+                f.seek(start)
+                self.wfile.write(f.read(length))
+
+    def _send_common_headers(self, etag: Optional[str] = None):
+        # The player runs in a srcdoc iframe, so requests come from a null origin
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Expose-Headers", "ETag, Content-Range, Accept-Ranges")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Cache-Control", "public, max-age=86400")
+        if etag:
+            self.send_header("ETag", etag)
+
+    @staticmethod
+    def _resolve(url_path: str) -> Optional[str]:
+        """Map a request path to a file inside AUDIO_DIR, rejecting traversal"""
+        if not url_path.startswith(AUDIO_ROUTE):
+            return None
+        root = os.path.realpath(AUDIO_DIR)
+        full_path = os.path.realpath(os.path.join(root, unquote(url_path[len(AUDIO_ROUTE):])))
+        if not full_path.startswith(root + os.sep) or not os.path.isfile(full_path):
+            return None
+        return full_path
+
+
+def _parse_range(header: str, size: int):
+    """Parse a single 'bytes=a-b' range, returning (start, end) or None"""
+    if not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first == "":  # Suffix range: last N bytes
+            start, end = max(0, size - int(last)), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        return None
+    return start, end
+
+
+def start_audio_server() -> str:
+    """
+    Start the audio server in a daemon thread (once per process)
+
+    If the port is already taken, another app process is assumed to be
+    serving the same AUDIO_DIR and its URL is reused.
+
+    Returns:
+        Base URL for audio files (without trailing slash)
+    """
+    global _base_url
+    with _server_lock:
+        if _base_url is None:
+            try:
+                server = ThreadingHTTPServer((AUDIO_SERVER_HOST, AUDIO_SERVER_PORT), AudioRequestHandler)
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name="audio-server", daemon=True).start()
+            except OSError as e:
+                print(f"Audio server not started ({e}); assuming one is already running")
+            _base_url = f"http://{AUDIO_SERVER_HOST}:{AUDIO_SERVER_PORT}{AUDIO_ROUTE.rstrip('/')}"
+        return _base_url
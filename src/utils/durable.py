@@ -0,0 +1,119 @@
+"""
+Durable File Writes
+Atomic replace-on-write and cross-process advisory locks for data files
+"""
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict
+from utils.profiling import count_bytes
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def atomic_write_json(path: str, data: Any, **dump_kwargs):
+    """
+    Write JSON so readers see either the old file or the new one, never a mix
+
+    The data is written to a temp file in the same directory, flushed to
+    disk and renamed over `path`.
+
+    Args:
+        path: Target file path
+        data: JSON-serializable data
+        **dump_kwargs: Passed to json.dump (ensure_ascii defaults to False)
+    """
+    dump_kwargs.setdefault('ensure_ascii', False)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    encoded = json.dumps(data, **dump_kwargs).encode('utf-8')
+    count_bytes('write.json', len(encoded))
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class _PathLock:
+    """Thread-reentrant lock backed by an OS lock on a sidecar file"""
+
+    def __init__(self, lock_path: str):
+        self.lock_path = lock_path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd = None
+
+    def acquire(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+                self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                if fcntl:
+                    fcntl.flock(self._fd, fcntl.LOCK_EX)
+                else:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+            except BaseException:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                if fcntl:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._thread_lock.release()
+
+
+_path_locks: Dict[str, _PathLock] = {}
+_path_locks_guard = threading.Lock()
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Hold an exclusive advisory lock on a data file
+
+    Locks `<path>.lock`, so it works whether or not `path` exists and is
+    unaffected by atomic renames of `path`. Excludes other threads and
+    other processes (Streamlit workers, CLI jobs); re-entering from the
+    same thread is allowed.
+
+    Args:
+        path: Data file to protect
+    """
+    lock_path = os.path.abspath(path) + ".lock"
+    with _path_locks_guard:
+        lock = _path_locks.setdefault(lock_path, _PathLock(lock_path))
+
+    lock.acquire()
+    try:
+        yield
+    finally:
+        lock.release()
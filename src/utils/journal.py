@@ -0,0 +1,86 @@
+"""
+Append-Only Journal
+JSON-lines log used for incremental writes between compactions
+"""
+import json
+import os
+from typing import Dict, List, Tuple
+from utils.profiling import count_bytes
+
+
+class Journal:
+    """
+    Append-only JSON-lines file
+
+    Readers keep a byte offset and tail new records with read_from(), so
+    several processes can share one journal without re-reading it.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def size(self) -> int:
+        """Current journal size in bytes (0 if missing)"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def append(self, records: List[Dict], sync: bool = False):
+        """
+        Append records as JSON lines
+
+        Args:
+            records: JSON-serializable dictionaries
+            sync: fsync before returning, so the records survive a crash
+        """
+        if not records:
+            return
+
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode('utf-8')
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        count_bytes('write.journal', len(data))
+        with open(self.path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+
+    def read_from(self, offset: int) -> Tuple[List[Dict], int]:
+        """
+        Read complete records written after a byte offset
+
+        Args:
+            offset: Byte offset returned by a previous call (0 for start)
+
+        Returns:
+            Tuple of (records, new_offset). A trailing partial line from an
+            in-progress write is left for the next call.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+        if data:
+            count_bytes('read.journal', len(data))
+
+        records = []
+        end = offset
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                print(f"Skipping corrupt journal line in {self.path}: {e}")
+
+        return records, end
+
+    def truncate(self):
+        """Discard all records"""
+        if os.path.exists(self.path):
+            with open(self.path, 'wb'):
+                pass
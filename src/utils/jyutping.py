@@ -2,7 +2,100 @@
 Jyutping Utilities
 Convert Cantonese characters to Jyutping romanization
 """
-import pycantonese
+import threading
+from typing import Dict, List, Optional
+from core.constants import JYUTPING_CACHE_PATH
+from utils.journal import Journal
+
+# pycantonese segmentation: [[word, jyutping or None], ...]
+Segments = List[List[Optional[str]]]
+
+
+class JyutpingCache:
+    """
+    Text -> pycantonese segmentation, persisted in an append-only journal
+
+    Lookups convert only the texts not seen before (in this process or any
+    other) and record them with a single journal append, so common chunks
+    and repeated sentences never reach pycantonese twice.
+    """
+
+    def __init__(self, path: str):
+        self.journal = Journal(path)
+        self._lock = threading.Lock()
+        self._segments: Dict[str, Segments] = {}
+        self._offset = 0
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, texts: List[str]) -> Dict[str, Segments]:
+        """
+        Get segmentations for texts, converting the missing ones in one batch
+
+        Args:
+            texts: Cantonese strings (duplicates are fine)
+
+        Returns:
+            Dict of text -> segments ([] where conversion failed)
+        """
+        with self._lock:
+            self._refresh()
+            missing = [t for t in dict.fromkeys(texts) if t not in self._segments]
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+
+            records = []
+            for text in missing:
+                segments = _convert(text)
+                if segments is not None:
+                    records.append({'text': text, 'segments': segments})
+            self.journal.append(records)
+            # Our own records come back with anything other processes added
+            self._refresh()
+
+            return {t: self._segments.get(t, []) for t in texts}
+
+    def _refresh(self):
+        if self.journal.size() < self._offset:
+            self._segments = {}
+            self._offset = 0
+        records, self._offset = self.journal.read_from(self._offset)
+        for record in records:
+            self._segments[record['text']] = record['segments']
+
+
+def _convert(text: str) -> Optional[Segments]:
+    # pycantonese loads its corpus on import; cache hits never need it
+    import pycantonese
+
+    try:
+        return [[word, jyutping] for word, jyutping in pycantonese.characters_to_jyutping(text)]
+    except Exception as e:
+        print(f"Error converting to Jyutping: {e}")
+        return None
+
+
+_cache: Optional[JyutpingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_jyutping_cache() -> JyutpingCache:
+    """Get the process-wide Jyutping cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = JyutpingCache(JYUTPING_CACHE_PATH)
+        return _cache
+
+
+def warm_up_jyutping():
+    """Import pycantonese and load its data ahead of the first conversion"""
+    _convert("你好")
+
+
+def _join(segments: Segments) -> str:
+    # Punctuation and unknown characters have no Jyutping and are skipped
+    return " ".join(jyutping for _, jyutping in segments if jyutping)
 
 
 def get_jyutping(text: str) -> str:
@@ -15,17 +108,76 @@ def get_jyutping(text: str) -> str:
     Returns:
         Space-separated Jyutping string (e.g., "nei5 hou2")
     """
-    try:
-        # Get character-to-jyutping mappings
-        characters = pycantonese.characters_to_jyutping(text)
+    return _join(get_jyutping_cache().lookup([text])[text])
 
-        # Join into space-separated string
-        jyutping_str = " ".join([char[1] for char in characters])
 
-        return jyutping_str
-    except Exception as e:
-        print(f"Error converting to Jyutping: {e}")
-        return ""
+def _chunk_from_sentence(sentence: str, segments: Segments, start: int, end: int) -> Optional[str]:
+    """
+    Jyutping for sentence[start:end] taken from the sentence's segmentation
+
+    Returns None when a word overlapping the span can't be split into one
+    syllable per character, or the segmentation doesn't line up with the text.
+    """
+    syllables = []
+    pos = 0
+    for word, jyutping in segments:
+        word_start = sentence.find(word, pos)
+        if word_start == -1:
+            return None
+        word_end = pos = word_start + len(word)
+        if word_end <= start or word_start >= end or not jyutping:
+            continue
+
+        if start <= word_start and word_end <= end:
+            syllables.append(jyutping)
+            continue
+
+        # The chunk splits this word: map characters to syllables
+        word_syllables = jyutping.split()
+        if len(word_syllables) != len(word):
+            return None
+        syllables.extend(word_syllables[max(start, word_start) - word_start:min(end, word_end) - word_start])
+    return " ".join(syllables)
+
+
+def annotate_jyutping(sentences: List[Dict]):
+    """
+    Add 'jyutping' to sentences and their chunks in place, in one pass
+
+    Sentences are converted as a batch through the cache. Chunks are
+    verbatim, in-order pieces of their sentence, so their Jyutping is read
+    off the sentence segmentation (which also picks the reading that fits
+    the context); only chunks that can't be aligned are converted on their
+    own, again as one batch.
+
+    Args:
+        sentences: Sentence dicts with 'cantonese' and optional 'chunks'
+    """
+    cache = get_jyutping_cache()
+    sentence_segments = cache.lookup([s['cantonese'] for s in sentences])
+
+    unaligned = []
+    for sentence in sentences:
+        text = sentence['cantonese']
+        segments = sentence_segments[text]
+        sentence['jyutping'] = _join(segments)
+
+        cursor = 0
+        for chunk in sentence.get('chunks', []):
+            start = text.find(chunk['cantonese'], cursor)
+            jyutping = None
+            if start != -1 and chunk['cantonese']:
+                cursor = start + len(chunk['cantonese'])
+                jyutping = _chunk_from_sentence(text, segments, start, cursor)
+            if jyutping is None:
+                unaligned.append(chunk)
+            else:
+                chunk['jyutping'] = jyutping
+
+    if unaligned:
+        chunk_segments = cache.lookup([c['cantonese'] for c in unaligned])
+        for chunk in unaligned:
+            chunk['jyutping'] = _join(chunk_segments[chunk['cantonese']])
 
 
 def validate_jyutping(jyutping: str) -> bool:
@@ -43,4 +195,4 @@ def validate_jyutping(jyutping: str) -> bool:
     for syllable in syllables:
         if not syllable or not syllable[-1].isdigit():
             return False
-    return True
\ No newline at end of file
+    return True
@@ -0,0 +1,169 @@
+"""
+Profiling
+Process-wide latency histograms and I/O byte counters for spotting regressions
+"""
+import functools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+from core.constants import PROFILING_ENABLED
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+RECENT_SAMPLES = 256  # Per metric, for percentiles
+
+
+class LatencyStats:
+    """Counts, bucket histogram and recent samples for one timed operation"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def add(self, ms: float):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for i, bound in enumerate(BUCKET_BOUNDS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.recent.append(ms)
+
+    def to_dict(self) -> Dict:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))], 3) if recent else 0.0
+
+        labels = [f"<={b}ms" for b in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}ms"]
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(self.max_ms, 3),
+            'total_ms': round(self.total_ms, 3),
+            'histogram': {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+
+class Profiler:
+    """
+    Thread-safe registry of named timings and byte counters
+
+    Recording is a perf_counter call and a dict update under a lock, cheap
+    enough to leave on; set CANTO_PROFILE=0 to make every hook a no-op.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._latency: Dict[str, LatencyStats] = {}
+        self._bytes: Dict[str, Dict[str, int]] = {}
+        self._started = time.time()
+
+    def record(self, name: str, seconds: float):
+        """Add one latency sample"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._latency.get(name)
+            if stats is None:
+                stats = self._latency[name] = LatencyStats()
+            stats.add(seconds * 1000)
+
+    def record_once(self, name: str, seconds: float):
+        """Add a sample only if `name` has none yet (e.g. process startup)"""
+        with self._lock:
+            if name in self._latency:
+                return
+        self.record(name, seconds)
+
+    def count_bytes(self, name: str, nbytes: int):
+        """Add to an I/O byte counter (also counts operations)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            counter = self._bytes.setdefault(name, {'ops': 0, 'bytes': 0})
+            counter['ops'] += 1
+            counter['bytes'] += nbytes
+
+    def snapshot(self) -> Dict:
+        """All metrics as plain data"""
+        with self._lock:
+            return {
+                'since': self._started,
+                'captured_at': time.time(),
+                'latency': {name: stats.to_dict() for name, stats in sorted(self._latency.items())},
+                'io': {name: dict(counter) for name, counter in sorted(self._bytes.items())}
+            }
+
+    def reset(self):
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._latency.clear()
+            self._bytes.clear()
+            self._started = time.time()
+
+
+_profiler = Profiler(PROFILING_ENABLED)
+
+
+def get_profiler() -> Profiler:
+    """Get the process-wide profiler"""
+    return _profiler
+
+
+@contextmanager
+def timed(name: str):
+    """Time the enclosed block under `name`"""
+    if not _profiler.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profiler.record(name, time.perf_counter() - start)
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """
+    Decorator that times every call of a function
+
+    Args:
+        name: Metric name (defaults to module.function)
+    """
+    def decorator(func: Callable) -> Callable:
+        metric = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _profiler.record(metric, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def count_bytes(name: str, nbytes: int):
+    """Add to the process-wide I/O byte counter `name`"""
+    _profiler.count_bytes(name, nbytes)
+
+
+def export_json() -> str:
+    """Metrics snapshot as a JSON document"""
+    return json.dumps(_profiler.snapshot(), indent=2)